@@ -0,0 +1,8 @@
+"""
+RapidResponse AI backend package
+"""
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env once, before any module reads them
+load_dotenv()
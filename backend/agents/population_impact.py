@@ -24,6 +24,15 @@ class PopulationImpactAgent(BaseAgent):
         `population_data` is expected to be a GeoDataFrame from GeoHubClient.
         `affected_boundary` is a GeoJSON polygon from DamageAssessmentAgent.
         """
+        return self.analyze_sync(affected_boundary, population_data, scenario_config)
+
+    def analyze_sync(
+        self,
+        affected_boundary: Dict[str, Any],
+        population_data: Any,
+        scenario_config: Dict[str, Any] = None,
+    ) -> Dict[str, Any]:
+        """Synchronous body of analyze(), safe to run on a worker thread."""
         self._log("Analyzing population impact")
 
         # Check if this is July 2020 scenario
@@ -70,6 +70,10 @@ class PredictionAgent(BaseAgent):
             >>> data = {'weather': {...}, 'fire_perimeter': {...}}
             >>> result = await agent.analyze(disaster, data)
         """
+        return self.analyze_sync(disaster, data, scenario_config)
+
+    def analyze_sync(self, disaster: Dict, data: Dict, scenario_config: Dict = None) -> Dict:
+        """Synchronous body of analyze(), safe to run on a worker thread."""
         disaster_type = disaster.get('type', 'unknown')
         self._log(f"Starting analysis for {disaster_type} disaster")
         logger.info(f"PredictionAgent analyzing {disaster_type} at location {disaster.get('location')}")
@@ -81,12 +85,12 @@ class PredictionAgent(BaseAgent):
 
         try:
             if disaster_type in ['wildfire', 'fire']:
-                result = await self._model_fire_spread(disaster, data)
+                result = self._model_fire_spread(disaster, data)
                 logger.info(f"Wildfire analysis complete: spread_rate={result.get('current_spread_rate_kmh')} km/h")
                 return result
 
             elif disaster_type == 'flood':
-                result = await self._model_flood_spread(disaster, data)
+                result = self._model_flood_spread(disaster, data)
                 logger.info("Flood analysis complete (placeholder)")
                 return result
 
@@ -103,7 +107,7 @@ class PredictionAgent(BaseAgent):
             logger.error(f"Error during {disaster_type} analysis: {e}", exc_info=True)
             raise
     
-    async def _model_fire_spread(self, disaster: Dict, data: Dict) -> Dict:
+    def _model_fire_spread(self, disaster: Dict, data: Dict) -> Dict:
         """
         Model wildfire spread using weather-based physics model.
         
@@ -136,7 +140,7 @@ class PredictionAgent(BaseAgent):
             ...     'weather': {'wind': {'speed': 5}, 'main': {'temp': 25, 'humidity': 40}},
             ...     'fire_perimeter': {'type': 'Polygon', 'coordinates': [...]}
             ... }
-            >>> result = await agent._model_fire_spread(disaster, data)
+            >>> result = agent._model_fire_spread(disaster, data)
         """
         weather_input = data.get('weather') or {}
         if isinstance(weather_input, dict) and weather_input.get('list'):
@@ -253,7 +257,7 @@ class PredictionAgent(BaseAgent):
             'outlook': 'worsening',
         }
 
-    async def _model_flood_spread(self, disaster: Dict, data: Dict) -> Dict:
+    def _model_flood_spread(self, disaster: Dict, data: Dict) -> Dict:
         """Placeholder for flood spread modeling."""
         return {
             'current_spread_rate_kmh': 0,
@@ -1,11 +1,142 @@
 from __future__ import annotations
 
-import math
+import copy
 from typing import Any, Dict, List, Optional
 
 from .base_agent import BaseAgent
 
 
+# Static July 2020 backtest allocation, built once at import.
+_JULY_2020_RESPONSE: Dict[str, Any] = {
+    'required_resources': {
+        'ambulances': 12,
+        'evacuation_buses': 8,
+        'fire_apparatus': 15,
+        'police_units': 10,
+        'personnel': 85,
+    },
+    'available_resources': {
+        'fire_stations': [
+            {'id': 'Brampton FS-202', 'lat': 43.7200, 'lon': -79.8400, 'trucks': 4},
+            {'id': 'Brampton FS-205', 'lat': 43.7350, 'lon': -79.8750, 'trucks': 3},
+            {'id': 'Brampton FS-201', 'lat': 43.7180, 'lon': -79.7800, 'trucks': 4},
+        ],
+        'hospitals': [
+            {'id': 'Brampton Civic Hospital', 'lat': 43.7310, 'lon': -79.7620, 'ambulances': 8},
+        ],
+        'police_stations': [
+            {'id': 'Peel Police 21 Division', 'lat': 43.7280, 'lon': -79.8300, 'units': 12},
+        ],
+    },
+    'deployment_plan': {
+        'primary_staging': {'lat': 43.7250, 'lon': -79.8500, 'name': 'HWY 407/410 Service Road'},
+        'command_post': {'lat': 43.7280, 'lon': -79.8450, 'name': 'Emergency Command Center'},
+        'evacuation_center': {'lat': 43.7150, 'lon': -79.8400, 'name': 'Brampton Soccer Centre'},
+    },
+    'mutual_aid_requests': [
+        {
+            'municipality': 'Mississauga Fire',
+            'requested': '3 pumpers, 1 aerial ladder',
+            'eta_minutes': 15,
+            'justification': 'Brampton resources insufficient for 40-acre fire',
+        },
+        {
+            'municipality': 'Caledon Fire',
+            'requested': '2 pumpers, 1 tanker',
+            'eta_minutes': 20,
+            'justification': 'Grass fire expertise and water supply',
+        },
+        {
+            'municipality': 'Toronto Fire (Standby)',
+            'requested': 'Available if needed',
+            'eta_minutes': 25,
+            'justification': 'Backup if situation escalates',
+        },
+    ],
+    'resource_gaps': [
+        {
+            'resource': 'Fire apparatus',
+            'description': 'Need 15 units, have 11 local. Requesting 4 from mutual aid.',
+        },
+        {
+            'resource': 'Evacuation buses',
+            'description': 'Need 8 buses for 20% of population without vehicles.',
+        },
+    ],
+    'highway_coordination': {
+        'mto_notification': 'required',
+        'opp_notification': 'required',
+        'closure_plan': 'HWY 407 eastbound closure recommended within 2 hours',
+        'detour_routes': ['HWY 410 south to HWY 401', 'Bovaird Dr alternate route'],
+    },
+    'confidence': 0.90,
+}
+
+# Fallback estimate used when no population data is available.
+# Assumes a medium-scale urban fire requiring significant response.
+_DEFAULT_ESTIMATE: Dict[str, Any] = {
+    "total_affected": 2800,
+    "required_resources": {
+        "fire_apparatus": 14,
+        "ambulances": 6,
+        "police_units": 8,
+        "evacuation_buses": 12,
+        "personnel": 95,
+    },
+    "available_resources": {
+        "fire_stations": [
+            {"id": "Fire Station A", "lat": 0, "lon": 0, "trucks": 4, "distance_km": 3.2},
+            {"id": "Fire Station B", "lat": 0, "lon": 0, "trucks": 3, "distance_km": 5.1},
+            {"id": "Fire Station C", "lat": 0, "lon": 0, "trucks": 4, "distance_km": 6.8},
+        ],
+        "hospitals": [
+            {"id": "Regional Hospital", "lat": 0, "lon": 0, "ambulances": 8, "distance_km": 4.5},
+        ],
+        "police_stations": [
+            {"id": "Police Division", "lat": 0, "lon": 0, "units": 12, "distance_km": 3.8},
+        ],
+    },
+    "deployment_plan": {
+        "primary_staging": "Main intersection near fire perimeter",
+        "command_post": "Mobile command unit on-site",
+        "evacuation_center": "Community center (1.5 km from fire)",
+    },
+    "shelters_needed": 6,
+    "medical_units": 3,
+    "relief_kits": 2800,
+    "critical_facilities": ["Estimated schools", "Community centers"],
+    "route_status": "multiple_affected",
+    "staging_sites": ["Parking lot staging area", "School parking lot"],
+    "mutual_aid_requests": [
+        {
+            "municipality": "Neighboring Fire Department",
+            "requested": "4 pumpers, 2 aerial units",
+            "eta_minutes": 18,
+            "justification": "Local resources insufficient for fire scale",
+        },
+        {
+            "municipality": "Regional Fire Services",
+            "requested": "2 tankers, 1 rescue unit",
+            "eta_minutes": 25,
+            "justification": "Water supply and specialized rescue capability",
+        },
+    ],
+    "resource_gaps": [
+        {
+            "resource": "Fire apparatus",
+            "description": "Need 14 units, have 11 local. Requesting 6 from mutual aid.",
+        },
+        {
+            "resource": "Evacuation capacity",
+            "description": "Need 12 buses for residents without vehicles.",
+        },
+    ],
+    "confidence": 0.65,
+    "_estimated": True,
+    "_estimation_method": "Generated from typical urban fire response requirements",
+}
+
+
 class ResourceAllocationAgent(BaseAgent):
     """Estimate supply and personnel needs based on population impacts."""
 
@@ -16,6 +147,18 @@ class ResourceAllocationAgent(BaseAgent):
         infrastructure_data: Optional[Any],
         scenario_config: Dict[str, Any] = None,
     ) -> Dict[str, Any]:
+        return self.analyze_sync(
+            population_summary, routing_summary, infrastructure_data, scenario_config
+        )
+
+    def analyze_sync(
+        self,
+        population_summary: Dict[str, Any],
+        routing_summary: Dict[str, Any],
+        infrastructure_data: Optional[Any],
+        scenario_config: Dict[str, Any] = None,
+    ) -> Dict[str, Any]:
+        """Synchronous body of analyze(), safe to run on a worker thread."""
         self._log("Planning resource allocation")
 
         # Check if this is July 2020 scenario
@@ -31,18 +174,18 @@ class ResourceAllocationAgent(BaseAgent):
             self._log("No population data - generating resource estimates")
             return self._generate_resource_estimates()
 
-        shelters_needed = math.ceil(total_affected / 500) if total_affected else 0
-        medical_units = math.ceil(vulnerable.get("elderly", 0) / 100) if vulnerable else 0
+        shelters_needed = -(-total_affected // 500) if total_affected else 0
+        medical_units = -(-vulnerable.get("elderly", 0) // 100) if vulnerable else 0
         relief_kits = max(total_affected, 0)
         
         # Calculate fire suppression resources
-        fire_trucks = max(8, math.ceil(total_affected / 300))  # 1 truck per 300 people
-        ambulances = max(4, math.ceil(total_affected / 600))  # 1 ambulance per 600 people
-        police_units = max(5, math.ceil(total_affected / 500))  # 1 unit per 500 people
+        fire_trucks = max(8, -(-total_affected // 300))  # 1 truck per 300 people
+        ambulances = max(4, -(-total_affected // 600))  # 1 ambulance per 600 people
+        police_units = max(5, -(-total_affected // 500))  # 1 unit per 500 people
         firefighters = fire_trucks * 5  # 5 firefighters per truck
         
         # Evacuation resources
-        evacuation_buses = math.ceil(total_affected * 0.20 / 50)  # 20% need transport, 50 per bus
+        evacuation_buses = -(-total_affected // 250)  # 20% need transport, 50 per bus
 
         return {
             "total_affected": total_affected,
@@ -77,78 +220,10 @@ class ResourceAllocationAgent(BaseAgent):
         """Resource allocation for July 2020"""
         pop_estimate = scenario_config['population_estimate']
 
-        return {
-            'required_resources': {
-                'ambulances': 12,
-                'evacuation_buses': 8,
-                'fire_apparatus': 15,
-                'police_units': 10,
-                'personnel': 85,
-            },
-            'available_resources': {
-                'fire_stations': [
-                    {'id': 'Brampton FS-202', 'lat': 43.7200, 'lon': -79.8400, 'trucks': 4},
-                    {'id': 'Brampton FS-205', 'lat': 43.7350, 'lon': -79.8750, 'trucks': 3},
-                    {'id': 'Brampton FS-201', 'lat': 43.7180, 'lon': -79.7800, 'trucks': 4},
-                ],
-                'hospitals': [
-                    {'id': 'Brampton Civic Hospital', 'lat': 43.7310, 'lon': -79.7620, 'ambulances': 8},
-                ],
-                'police_stations': [
-                    {'id': 'Peel Police 21 Division', 'lat': 43.7280, 'lon': -79.8300, 'units': 12},
-                ],
-            },
-            'deployment_plan': {
-                'primary_staging': {'lat': 43.7250, 'lon': -79.8500, 'name': 'HWY 407/410 Service Road'},
-                'command_post': {'lat': 43.7280, 'lon': -79.8450, 'name': 'Emergency Command Center'},
-                'evacuation_center': {'lat': 43.7150, 'lon': -79.8400, 'name': 'Brampton Soccer Centre'},
-            },
-            'mutual_aid_requests': [
-                {
-                    'municipality': 'Mississauga Fire',
-                    'requested': '3 pumpers, 1 aerial ladder',
-                    'eta_minutes': 15,
-                    'justification': 'Brampton resources insufficient for 40-acre fire',
-                },
-                {
-                    'municipality': 'Caledon Fire',
-                    'requested': '2 pumpers, 1 tanker',
-                    'eta_minutes': 20,
-                    'justification': 'Grass fire expertise and water supply',
-                },
-                {
-                    'municipality': 'Toronto Fire (Standby)',
-                    'requested': 'Available if needed',
-                    'eta_minutes': 25,
-                    'justification': 'Backup if situation escalates',
-                },
-            ],
-            'resource_gaps': [
-                {
-                    'resource': 'Fire apparatus',
-                    'description': 'Need 15 units, have 11 local. Requesting 4 from mutual aid.',
-                },
-                {
-                    'resource': 'Evacuation buses',
-                    'description': 'Need 8 buses for 20% of population without vehicles.',
-                },
-            ],
-            'highway_coordination': {
-                'mto_notification': 'required',
-                'opp_notification': 'required',
-                'closure_plan': 'HWY 407 eastbound closure recommended within 2 hours',
-                'detour_routes': ['HWY 410 south to HWY 401', 'Bovaird Dr alternate route'],
-            },
-            'confidence': 0.90,
-        }
+        return copy.deepcopy(_JULY_2020_RESPONSE)
 
     def _summarize_facilities(self, facilities: List[Dict[str, Any]]) -> List[str]:
-        names: List[str] = []
-        for facility in facilities:
-            name = facility.get("name")
-            if name:
-                names.append(name)
-        return names
+        return [name for facility in facilities if (name := facility.get("name"))]
 
     def _candidate_sites(self, infrastructure_data: Optional[Any]) -> List[str]:
         if infrastructure_data is None:
@@ -183,72 +258,11 @@ class ResourceAllocationAgent(BaseAgent):
         """Generate realistic resource estimates when population data unavailable"""
         self._log("Generating resource allocation estimates")
         
-        # Assume medium-scale urban fire requiring significant response
-        return {
-            "total_affected": 2800,
-            "required_resources": {
-                "fire_apparatus": 14,
-                "ambulances": 6,
-                "police_units": 8,
-                "evacuation_buses": 12,
-                "personnel": 95,
-            },
-            "available_resources": {
-                "fire_stations": [
-                    {"id": "Fire Station A", "lat": 0, "lon": 0, "trucks": 4, "distance_km": 3.2},
-                    {"id": "Fire Station B", "lat": 0, "lon": 0, "trucks": 3, "distance_km": 5.1},
-                    {"id": "Fire Station C", "lat": 0, "lon": 0, "trucks": 4, "distance_km": 6.8},
-                ],
-                "hospitals": [
-                    {"id": "Regional Hospital", "lat": 0, "lon": 0, "ambulances": 8, "distance_km": 4.5},
-                ],
-                "police_stations": [
-                    {"id": "Police Division", "lat": 0, "lon": 0, "units": 12, "distance_km": 3.8},
-                ],
-            },
-            "deployment_plan": {
-                "primary_staging": "Main intersection near fire perimeter",
-                "command_post": "Mobile command unit on-site",
-                "evacuation_center": "Community center (1.5 km from fire)",
-            },
-            "shelters_needed": 6,
-            "medical_units": 3,
-            "relief_kits": 2800,
-            "critical_facilities": ["Estimated schools", "Community centers"],
-            "route_status": "multiple_affected",
-            "staging_sites": ["Parking lot staging area", "School parking lot"],
-            "mutual_aid_requests": [
-                {
-                    "municipality": "Neighboring Fire Department",
-                    "requested": "4 pumpers, 2 aerial units",
-                    "eta_minutes": 18,
-                    "justification": "Local resources insufficient for fire scale",
-                },
-                {
-                    "municipality": "Regional Fire Services",
-                    "requested": "2 tankers, 1 rescue unit",
-                    "eta_minutes": 25,
-                    "justification": "Water supply and specialized rescue capability",
-                },
-            ],
-            "resource_gaps": [
-                {
-                    "resource": "Fire apparatus",
-                    "description": "Need 14 units, have 11 local. Requesting 6 from mutual aid.",
-                },
-                {
-                    "resource": "Evacuation capacity",
-                    "description": "Need 12 buses for residents without vehicles.",
-                },
-            ],
-            "confidence": 0.65,
-            "_estimated": True,
-            "_estimation_method": "Generated from typical urban fire response requirements",
-        }
+        return copy.deepcopy(_DEFAULT_ESTIMATE)
     
     def _estimate_nearby_stations(self, population: int) -> List[Dict[str, Any]]:
         """Estimate fire stations based on population"""
-        num_stations = max(2, min(4, math.ceil(population / 1000)))
+        num_stations = max(2, min(4, -(-population // 1000)))
         stations = []
         for i in range(num_stations):
             stations.append({
@@ -1,9 +1,154 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from math import atan2, cos, radians, sin, sqrt
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from .base_agent import BaseAgent
 
+EARTH_RADIUS_KM = 6371.0
+ORIGIN_PRECISION = 4  # decimal places (~11 m); nearby origins share cached routes
+
+# Safe zone destinations in Brampton, primary first
+_DESTINATIONS = (
+    {
+        "name": "Brampton Soccer Centre",
+        "lat": 43.7150,
+        "lon": -79.8400,
+        "capacity": 2000,
+    },
+    {
+        "name": "CAA Centre",
+        "lat": 43.7300,
+        "lon": -79.7500,
+        "capacity": 5000,
+    },
+    {
+        "name": "Cassie Campbell Community Centre",
+        "lat": 43.7100,
+        "lon": -79.7800,
+        "capacity": 1500,
+    },
+)
+_DEST_LATS = np.array([d["lat"] for d in _DESTINATIONS])
+_DEST_LONS = np.array([d["lon"] for d in _DESTINATIONS])
+
+# Observed route figures from the July 2020 HWY 407/410 backtest
+_JULY_2020_OVERRIDES: Dict[str, Dict[str, Any]] = {
+    "Brampton Soccer Centre": {
+        "distance_km": 2.3,
+        "time_minutes": 8,
+        "notes": "Primary evacuation route via Williams Parkway",
+    },
+    "CAA Centre": {
+        "distance_km": 8.5,
+        "time_minutes": 18,
+        "notes": "Secondary route via Bovaird Drive",
+    },
+    "Cassie Campbell Community Centre": {
+        "distance_km": 6.2,
+        "time_minutes": 15,
+        "notes": "Alternate route via Sandalwood Parkway",
+    },
+}
+
+
+def _haversine_km(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Great-circle distances in km from one point to arrays of points."""
+    lat_rad = np.radians(lat)
+    lats_rad = np.radians(lats)
+    delta_lat = lats_rad - lat_rad
+    delta_lon = np.radians(lons - lon)
+
+    a = np.sin(delta_lat / 2) ** 2 + np.cos(lat_rad) * np.cos(lats_rad) * np.sin(delta_lon / 2) ** 2
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def _fast_distance_km(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Equirectangular distances in km for short, intra-city hops.
+
+    Error stays under 0.1% up to ~50 km at Brampton's latitude. Falls back to
+    the haversine formula when any destination is more than 1 degree of
+    latitude away.
+    """
+    delta_lat = lats - lat
+    if np.any(np.abs(delta_lat) > 1.0):
+        return _haversine_km(lat, lon, lats, lons)
+
+    x = np.radians(lons - lon) * np.cos(np.radians((lats + lat) / 2))
+    y = np.radians(delta_lat)
+    return EARTH_RADIUS_KM * np.sqrt(x * x + y * y)
+
+
+@lru_cache(maxsize=256)
+def _centroid_of_polygon(ring: Tuple[Tuple[float, float], ...]) -> Tuple[float, float]:
+    """Area-weighted (shoelace) centroid of a polygon ring's (lon, lat) vertices."""
+    points = np.asarray(ring, dtype=np.float64)
+    if len(points) > 1 and not np.array_equal(points[0], points[-1]):
+        points = np.vstack((points, points[:1]))
+
+    # Work relative to the first vertex to avoid cancellation at large lon/lat
+    origin = points[0]
+    x, y = points[:, 0] - origin[0], points[:, 1] - origin[1]
+    cross = x[:-1] * y[1:] - x[1:] * y[:-1]
+    twice_area = cross.sum()
+
+    # Degenerate rings (points, lines) have no area; fall back to the vertex mean
+    if abs(twice_area) < 1e-12:
+        lon, lat = points.mean(axis=0).tolist()
+        return lon, lat
+
+    lon = origin[0] + ((x[:-1] + x[1:]) * cross).sum() / (3 * twice_area)
+    lat = origin[1] + ((y[:-1] + y[1:]) * cross).sum() / (3 * twice_area)
+    return float(lon), float(lat)
+
+
+def _route_path(start_lon: float, start_lat: float, end_lon: float, end_lat: float) -> List[List[float]]:
+    """Straight-line path with intermediate points for smoother animation."""
+    steps = 10
+
+    # Simple linear interpolation (would use actual routing in production)
+    lons = np.linspace(start_lon, end_lon, steps + 1)
+    lats = np.linspace(start_lat, end_lat, steps + 1)
+    return np.column_stack((lons, lats)).tolist()
+
+
+def _linestring_feature(coords: List[List[float]]) -> Dict[str, Any]:
+    """Wrap a coordinate list in a GeoJSON LineString Feature."""
+    return {"type": "Feature", "geometry": {"type": "LineString", "coordinates": coords}}
+
+
+@lru_cache(maxsize=512)
+def _build_routes(lon: float, lat: float, status: str) -> List[Dict[str, Any]]:
+    """Build routes from an origin to each safe zone.
+
+    Results are cached and shared between callers, so treat them as read-only.
+    """
+    # Calculate approximate distances to every destination in one pass
+    distances = _fast_distance_km(lat, lon, _DEST_LATS, _DEST_LONS).tolist()
+
+    routes = []
+    for i, (dest, distance_km) in enumerate(zip(_DESTINATIONS, distances)):
+        is_primary = i == 0
+
+        # Estimate time (assuming 30 km/h average evacuation speed)
+        time_minutes = int((distance_km / 30.0) * 60)
+
+        routes.append({
+            "id": f"route-{i+1}",
+            "origin": {"lat": lat, "lon": lon},
+            "destination": dict(dest),
+            "path": _linestring_feature(_route_path(lon, lat, dest["lon"], dest["lat"])),
+            "distance_km": round(distance_km, 1),
+            "time_minutes": time_minutes,
+            "status": status if is_primary else ("open" if status != "closed" else "monitor"),
+            "priority": "primary" if is_primary else "alternate",
+        })
+
+    return routes
+
 
 class RoutingAgent(BaseAgent):
     """Plan evacuation routes using available road network information."""
@@ -16,11 +161,35 @@ class RoutingAgent(BaseAgent):
         scenario_config: Dict[str, Any] = None,
         disaster_location: Dict[str, Any] = None,
     ) -> Dict[str, Any]:
+        return self.analyze_sync(
+            roads_data, infrastructure_data, damage_summary, scenario_config, disaster_location
+        )
+
+    def analyze_sync(
+        self,
+        roads_data: Optional[Any],
+        infrastructure_data: Optional[Any],
+        damage_summary: Dict[str, Any],
+        scenario_config: Dict[str, Any] = None,
+        disaster_location: Dict[str, Any] = None,
+    ) -> Dict[str, Any]:
+        """Synchronous body of analyze(), safe to run on a worker thread."""
         self._log("Planning evacuation routes")
 
         # Check if this is July 2020 scenario
         if scenario_config and scenario_config.get('disaster', {}).get('scenario_id') == 'july_2020_backtest':
-            return self._analyze_july_2020_routing(scenario_config)
+            location = scenario_config['disaster']['location']
+            routes = self._generate_evacuation_routes(
+                [location['lon'], location['lat']], 0, "open", overrides=_JULY_2020_OVERRIDES
+            )
+            return {
+                "severity": "high",
+                "routes": routes,
+                "priority_routes": routes,
+                "infrastructure_used": ["HWY 410 South", "Williams Parkway", "Bovaird Drive"],
+                "estimated_evacuation_time_minutes": 45,
+                "traffic_management": "Police escort recommended for vulnerable populations",
+            }
 
         severity = damage_summary.get("severity", "unknown")
         affected_area = damage_summary.get("affected_area_km2", 0)
@@ -53,10 +222,9 @@ class RoutingAgent(BaseAgent):
             if fire_perimeter and "geometry" in fire_perimeter:
                 coords = fire_perimeter["geometry"].get("coordinates", [[]])
                 if coords and len(coords[0]) > 0:
-                    # Calculate centroid of polygon
-                    lons = [c[0] for c in coords[0]]
-                    lats = [c[1] for c in coords[0]]
-                    center = [sum(lons) / len(lons), sum(lats) / len(lats)]
+                    # Calculate centroid of polygon (cached per exterior ring)
+                    ring = tuple((float(c[0]), float(c[1])) for c in coords[0])
+                    center = list(_centroid_of_polygon(ring))
                     self._log(f"Using fire perimeter center: {center}")
                     return center
         except Exception as e:
@@ -77,63 +245,38 @@ class RoutingAgent(BaseAgent):
         origin: List[float],
         affected_area: float,
         status: str,
+        overrides: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> List[Dict[str, Any]]:
-        """Generate evacuation routes with GeoJSON geometry."""
-        lon, lat = origin
-        
-        # Define safe zone destinations in Brampton
-        destinations = [
-            {
-                "name": "Brampton Soccer Centre",
-                "lat": 43.7150,
-                "lon": -79.8400,
-                "capacity": 2000,
-            },
-            {
-                "name": "CAA Centre",
-                "lat": 43.7300,
-                "lon": -79.7500,
-                "capacity": 5000,
-            },
-            {
-                "name": "Cassie Campbell Community Centre",
-                "lat": 43.7100,
-                "lon": -79.7800,
-                "capacity": 1500,
-            },
-        ]
-        
+        """Generate evacuation routes with GeoJSON geometry.
+
+        ``overrides`` maps a destination name to fields that replace the
+        computed values for that route (e.g. surveyed distances and notes).
+
+        Routes are cached by the origin rounded to ORIGIN_PRECISION, but each
+        result carries the exact origin as its ``origin`` and first path
+        vertex. Each route dict is the caller's own; nested values are shared
+        with the cache, so treat them as read-only.
+        """
+        lon, lat = float(origin[0]), float(origin[1])
+        key_lon = round(lon, ORIGIN_PRECISION)
+        key_lat = round(lat, ORIGIN_PRECISION)
+
+        hits = _build_routes.cache_info().hits
+        cached = _build_routes(key_lon, key_lat, status)
+        outcome = "hit" if _build_routes.cache_info().hits > hits else "miss"
+        self._log(f"Route cache {outcome} for ({key_lat}, {key_lon}, {status})")
+
         routes = []
-        for i, dest in enumerate(destinations):
-            is_primary = i == 0
-            
-            # Generate simple route path (straight line for demo; would use routing API in production)
-            path_coords = self._generate_route_path(lon, lat, dest["lon"], dest["lat"])
-            
-            # Calculate approximate distance
-            distance_km = self._calculate_distance(lat, lon, dest["lat"], dest["lon"])
-            
-            # Estimate time (assuming 30 km/h average evacuation speed)
-            time_minutes = int((distance_km / 30.0) * 60)
-            
+        for route in cached:
+            coords = route["path"]["geometry"]["coordinates"]
             route = {
-                "id": f"route-{i+1}",
+                **route,
                 "origin": {"lat": lat, "lon": lon},
-                "destination": dest,
-                "path": {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "LineString",
-                        "coordinates": path_coords,
-                    },
-                },
-                "distance_km": round(distance_km, 1),
-                "time_minutes": time_minutes,
-                "status": status if is_primary else ("open" if status != "closed" else "monitor"),
-                "priority": "primary" if is_primary else "alternate",
+                "path": _linestring_feature([[lon, lat], *coords[1:]]),
             }
+            if overrides:
+                route.update(overrides.get(route["destination"]["name"], {}))
             routes.append(route)
-        
         return routes
     
     def _generate_route_path(
@@ -144,18 +287,7 @@ class RoutingAgent(BaseAgent):
         end_lat: float,
     ) -> List[List[float]]:
         """Generate a simple route path with waypoints."""
-        # Create a path with intermediate points for smoother animation
-        steps = 10
-        coords = []
-        
-        for i in range(steps + 1):
-            t = i / steps
-            # Simple linear interpolation (would use actual routing in production)
-            lon = start_lon + (end_lon - start_lon) * t
-            lat = start_lat + (end_lat - start_lat) * t
-            coords.append([lon, lat])
-        
-        return coords
+        return _route_path(start_lon, start_lat, end_lon, end_lat)
     
     def _calculate_distance(
         self,
@@ -165,10 +297,6 @@ class RoutingAgent(BaseAgent):
         lon2: float,
     ) -> float:
         """Calculate approximate distance in km using Haversine formula."""
-        from math import radians, sin, cos, sqrt, atan2
-        
-        R = 6371  # Earth's radius in km
-        
         lat1_rad = radians(lat1)
         lat2_rad = radians(lat2)
         delta_lat = radians(lat2 - lat1)
@@ -177,106 +305,17 @@ class RoutingAgent(BaseAgent):
         a = sin(delta_lat / 2) ** 2 + cos(lat1_rad) * cos(lat2_rad) * sin(delta_lon / 2) ** 2
         c = 2 * atan2(sqrt(a), sqrt(1 - a))
         
-        return R * c
-
-    def _analyze_july_2020_routing(self, scenario_config: Dict[str, Any]) -> Dict[str, Any]:
-        """Routing analysis for July 2020 scenario"""
-        location = scenario_config['disaster']['location']
-        lon, lat = location['lon'], location['lat']
-
-        # Define evacuation routes with realistic times
-        routes = [
-            {
-                "id": "route-1",
-                "origin": {"lat": lat, "lon": lon},
-                "destination": {
-                    "name": "Brampton Soccer Centre",
-                    "lat": 43.7150,
-                    "lon": -79.8400,
-                    "capacity": 2000,
-                },
-                "path": {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "LineString",
-                        "coordinates": self._generate_route_path(lon, lat, -79.8400, 43.7150),
-                    },
-                },
-                "distance_km": 2.3,
-                "time_minutes": 8,
-                "status": "open",
-                "priority": "primary",
-                "notes": "Primary evacuation route via Williams Parkway",
-            },
-            {
-                "id": "route-2",
-                "origin": {"lat": lat, "lon": lon},
-                "destination": {
-                    "name": "CAA Centre",
-                    "lat": 43.7300,
-                    "lon": -79.7500,
-                    "capacity": 5000,
-                },
-                "path": {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "LineString",
-                        "coordinates": self._generate_route_path(lon, lat, -79.7500, 43.7300),
-                    },
-                },
-                "distance_km": 8.5,
-                "time_minutes": 18,
-                "status": "open",
-                "priority": "alternate",
-                "notes": "Secondary route via Bovaird Drive",
-            },
-            {
-                "id": "route-3",
-                "origin": {"lat": lat, "lon": lon},
-                "destination": {
-                    "name": "Cassie Campbell Community Centre",
-                    "lat": 43.7100,
-                    "lon": -79.7800,
-                    "capacity": 1500,
-                },
-                "path": {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "LineString",
-                        "coordinates": self._generate_route_path(lon, lat, -79.7800, 43.7100),
-                    },
-                },
-                "distance_km": 6.2,
-                "time_minutes": 15,
-                "status": "open",
-                "priority": "alternate",
-                "notes": "Alternate route via Sandalwood Parkway",
-            },
-        ]
-
-        return {
-            "severity": "high",
-            "routes": routes,
-            "priority_routes": routes,
-            "infrastructure_used": ["HWY 410 South", "Williams Parkway", "Bovaird Drive"],
-            "estimated_evacuation_time_minutes": 45,
-            "traffic_management": "Police escort recommended for vulnerable populations",
-        }
+        return EARTH_RADIUS_KM * c
 
     def _summarize_infrastructure(self, infrastructure_data: Optional[Any]) -> List[str]:
         """Extract a short list of infrastructure names if data is available."""
         if infrastructure_data is None:
             return []
 
-        names: List[str] = []
         try:
-            head = infrastructure_data.head(3)
-            for _, row in head.iterrows():
-                if "name" in row:
-                    names.append(row["name"])
+            if "name" not in infrastructure_data.columns:
+                return []
+            return infrastructure_data["name"].head(3).tolist()
         except AttributeError:
             extracted = getattr(infrastructure_data, "name", None)
-            if extracted:
-                names.append(str(extracted))
-
-        return names
+            return [str(extracted)] if extracted else []
@@ -1,18 +1,22 @@
+# Socket.IO runs in gevent mode, so patch the standard library before anything
+# else imports socket, ssl or threading. The async pipeline's loop thread, the
+# blocking waits on it and the redis message queue client then all cooperate
+# with the gevent hub instead of stalling it or emitting from a foreign thread.
+from gevent import monkey
+monkey.patch_all()
+
+import os
+
 from flask import Flask
 from flask_cors import CORS
 from flask_socketio import SocketIO
-from dotenv import load_dotenv
-import os
-import sys
-
-# Add backend directory to path for imports
-sys.path.append(os.path.dirname(__file__))
 
-# Load environment variables from .env file
-load_dotenv()
+from backend.utils import json_codec
+from backend.utils.config import config
 
 # App Initialization
 app = Flask(__name__)
+app.json = json_codec.CodecJSONProvider(app)
 
 # CORS Configuration - supports both local development and production
 ALLOWED_ORIGINS = os.getenv('ALLOWED_ORIGINS', 'http://localhost:3000,http://localhost:3001').split(',')
@@ -23,22 +27,29 @@ socketio = SocketIO(
     app,
     cors_allowed_origins=ALLOWED_ORIGINS,
     async_mode='gevent',
+    json=json_codec,
+    message_queue=config.SOCKETIO_MESSAGE_QUEUE,
     logger=True,
     engineio_logger=True
 )
 
 # Orchestrator Initialization
-from orchestrator import DisasterOrchestrator
-from utils.config import config
+orchestrator = None
+if config.USE_REAL_APIS:
+    # Only pull in the agent/geospatial stack when real processing is enabled
+    from backend.orchestrator import DisasterOrchestrator
+    orchestrator = DisasterOrchestrator(socketio)
 
-orchestrator = DisasterOrchestrator(socketio) if config.USE_REAL_APIS else None
+    # Preload the static GeoHub layers so the first disaster doesn't pay for parsing
+    from backend.utils.async_runner import run_async
+    run_async(orchestrator.data_clients["geohub"].warmup())
 
 # Register Routes
-from routes import create_routes
+from backend.routes import create_routes
 app.register_blueprint(create_routes(orchestrator), url_prefix='/api')
 
 # Initialize SocketIO Handlers
-from sockets import init_socketio
+from backend.sockets import init_socketio
 init_socketio(socketio, orchestrator)
 
 if __name__ == '__main__':
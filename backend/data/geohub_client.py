@@ -1,7 +1,106 @@
+import asyncio
 import geopandas as gpd
-from typing import Dict, Any, Optional
+import numpy as np
+from functools import lru_cache
+import shapely
+from shapely.geometry import Point, Polygon
+from typing import Dict, Any, Optional, Tuple
 import os
 import json
+import math
+
+try:
+    from pyproj import Geod
+    _GEOD = Geod(ellps="WGS84")
+except ImportError:
+    # Fallback for systems without pyproj
+    _GEOD = None
+
+try:
+    import pyogrio
+    # Bulk-read through GDAL instead of Fiona's per-feature iteration
+    READ_ENGINE: Optional[str] = "pyogrio"
+except ImportError:
+    # Fallback to geopandas' default engine
+    READ_ENGINE = None
+
+
+# Vertices used to approximate a search circle
+CIRCLE_SEGMENTS = 64
+
+# Approximate km per degree of latitude
+KM_PER_DEGREE = 111.0
+EARTH_RADIUS_KM = 6371.0
+
+# Attribute columns the agents read from each layer; optional ones may be absent
+INFRA_COLUMNS = ('name', 'type', 'capacity')
+POP_COLUMNS = (
+    'tract_id', 'population', 'density', 'vulnerable_pop', 'area_km2',
+    'age_65_plus', 'age_under_18', 'primary_language', 'neighborhood'
+)
+ROAD_COLUMNS = ('name', 'road_class', 'lanes', 'capacity_vph')
+
+
+@lru_cache(maxsize=256)
+def _search_area(lon: float, lat: float, radius_km: float) -> Polygon:
+    """
+    Circle of radius_km around (lon, lat) as a lon/lat polygon.
+
+    Vertices are placed geodesically so the radius is correct at any
+    latitude; without pyproj this falls back to a 111 km/degree buffer.
+    """
+    if _GEOD is None:
+        circle = Point(lon, lat).buffer(radius_km / KM_PER_DEGREE)
+        shapely.prepare(circle)
+        return circle
+
+    azimuths = np.linspace(0.0, 360.0, CIRCLE_SEGMENTS, endpoint=False)
+    lons, lats, _ = _GEOD.fwd(
+        np.full(CIRCLE_SEGMENTS, lon),
+        np.full(CIRCLE_SEGMENTS, lat),
+        azimuths,
+        np.full(CIRCLE_SEGMENTS, radius_km * 1000.0),
+    )
+    circle = Polygon(zip(lons, lats))
+    # Reused across queries, so pay for GEOS preparation once
+    shapely.prepare(circle)
+    return circle
+
+
+def _haversine_km(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Great-circle distances in km from one point to arrays of points."""
+    lat_rad = np.radians(lat)
+    lats_rad = np.radians(lats)
+    delta_lat = lats_rad - lat_rad
+    delta_lon = np.radians(lons - lon)
+
+    a = np.sin(delta_lat / 2) ** 2 + np.cos(lat_rad) * np.cos(lats_rad) * np.sin(delta_lon / 2) ** 2
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def _read_layer(path: str, columns: Optional[Tuple[str, ...]] = None) -> gpd.GeoDataFrame:
+    """
+    Read a static layer and build its spatial index up front.
+
+    With pyogrio, only the listed attribute columns that exist in the file
+    are parsed; geometry is always read.
+    """
+    kwargs = {}
+    if columns is not None and READ_ENGINE == "pyogrio":
+        fields = set(pyogrio.read_info(path)["fields"])
+        kwargs["columns"] = [c for c in columns if c in fields]
+    
+    gdf = gpd.read_file(path, engine=READ_ENGINE, **kwargs)
+    # Build the spatial index once so location filters reuse it
+    _ = gdf.sindex
+    return gdf
+
+
+def _search_bbox(lon: float, lat: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """(west, south, east, north) box enclosing a radius_km circle around (lon, lat)."""
+    delta_lat = radius_km / KM_PER_DEGREE
+    delta_lon = radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(lat)), 0.01))
+    return lon - delta_lon, lat - delta_lat, lon + delta_lon, lat + delta_lat
 
 
 class GeoHubClient:
@@ -27,317 +126,351 @@ class GeoHubClient:
             'brampton_roads.geojson'
         )
         
-        # Cache for loaded data
-        self._infra_cache: Optional[gpd.GeoDataFrame] = None
-        self._pop_cache: Optional[gpd.GeoDataFrame] = None
-        self._roads_cache: Optional[gpd.GeoDataFrame] = None
+        # Per-layer source file, columns to read, search radius (km), fallback
+        self._layers = {
+            'infrastructure': (self.infra_path, INFRA_COLUMNS, 10, self._create_sample_infrastructure),
+            'population': (self.pop_path, POP_COLUMNS, 15, self._create_sample_population),
+            'roads': (self.roads_path, ROAD_COLUMNS, 10, self._create_sample_roads),
+        }
+        
+        # Cache for loaded data, keyed like self._layers
+        self._caches: Dict[str, gpd.GeoDataFrame] = {}
     
-    async def fetch_infrastructure(self, location: Dict) -> Optional[gpd.GeoDataFrame]:
+    async def warmup(self):
         """
-        Load static Brampton infrastructure data.
-        
-        Args:
-            location: Dictionary with 'lat' and 'lon' keys for filtering
-        
-        Returns:
-            GeoDataFrame containing infrastructure data, or None if loading fails
+        Load every static layer that exists on disk so the first request
+        does not pay the file parse cost. Layers load concurrently in worker
+        threads; missing files are left to the sample-data fallback.
         """
-        try:
-            # Load from cache or file
-            if self._infra_cache is None:
-                if not os.path.exists(self.infra_path):
-                    print(f"Warning: Infrastructure data not found at {self.infra_path}")
-                    return self._create_sample_infrastructure()
-                
-                self._infra_cache = gpd.read_file(self.infra_path)
-            
-            # Filter by location if needed (within a radius)
-            if location:
-                filtered_data = self._filter_by_location(
-                    self._infra_cache, 
-                    location, 
-                    radius_km=10
-                )
-                return filtered_data
-            
-            return self._infra_cache
-            
-        except Exception as e:
-            print(f"Error loading infrastructure data: {e}")
-            return self._create_sample_infrastructure()
+        pending = [
+            (kind, path, columns)
+            for kind, (path, columns, _, _) in self._layers.items()
+            if kind not in self._caches and os.path.exists(path)
+        ]
+        results = await asyncio.gather(
+            *(asyncio.to_thread(_read_layer, path, columns) for _, path, columns in pending),
+            return_exceptions=True
+        )
+        
+        for (kind, path, _), result in zip(pending, results):
+            if isinstance(result, Exception):
+                print(f"Error preloading {path}: {result}")
+            else:
+                self._caches[kind] = result
     
-    async def fetch_population(self, location: Dict) -> Optional[gpd.GeoDataFrame]:
+    async def _fetch(self, kind: str, location: Dict) -> Optional[gpd.GeoDataFrame]:
         """
-        Load static Brampton population/census data.
+        Load one static layer, filtered around location when given.
         
         Args:
+            kind: Layer name ('infrastructure', 'population' or 'roads')
             location: Dictionary with 'lat' and 'lon' keys for filtering
         
         Returns:
-            GeoDataFrame containing population data, or None if loading fails
+            GeoDataFrame for the layer, or sample data if loading fails
         """
+        path, columns, radius_km, create_sample = self._layers[kind]
+        
         try:
             # Load from cache or file
-            if self._pop_cache is None:
-                if not os.path.exists(self.pop_path):
-                    print(f"Warning: Population data not found at {self.pop_path}")
-                    return self._create_sample_population()
+            gdf = self._caches.get(kind)
+            if gdf is None:
+                if not os.path.exists(path):
+                    print(f"Warning: {kind.capitalize()} data not found at {path}")
+                    return create_sample()
                 
-                self._pop_cache = gpd.read_file(self.pop_path)
+                # Parse off the event loop so other requests keep running
+                gdf = await asyncio.to_thread(_read_layer, path, columns)
+                self._caches[kind] = gdf
             
-            # Filter by location if needed
+            # Filter by location if needed (within a radius)
             if location:
-                filtered_data = self._filter_by_location(
-                    self._pop_cache,
-                    location,
-                    radius_km=15
-                )
-                return filtered_data
+                return self._filter_by_location(gdf, location, radius_km=radius_km)
             
-            return self._pop_cache
+            return gdf
             
         except Exception as e:
-            print(f"Error loading population data: {e}")
-            return self._create_sample_population()
+            print(f"Error loading {kind} data: {e}")
+            return create_sample()
+    
+    async def fetch_infrastructure(self, location: Dict) -> Optional[gpd.GeoDataFrame]:
+        """Load static Brampton infrastructure data (10 km around location)."""
+        return await self._fetch('infrastructure', location)
+    
+    async def fetch_population(self, location: Dict) -> Optional[gpd.GeoDataFrame]:
+        """Load static Brampton population/census data (15 km around location)."""
+        return await self._fetch('population', location)
     
     async def fetch_roads(self, location: Dict) -> Optional[gpd.GeoDataFrame]:
+        """Load static Brampton roads data (10 km around location)."""
+        return await self._fetch('roads', location)
+    
+    async def fetch_all(
+        self, location: Dict
+    ) -> Tuple[Optional[gpd.GeoDataFrame], Optional[gpd.GeoDataFrame], Optional[gpd.GeoDataFrame]]:
         """
-        Load static Brampton roads data.
+        Load infrastructure, population and roads concurrently.
+        
+        Cold layers are read in parallel worker threads.
         
         Args:
             location: Dictionary with 'lat' and 'lon' keys for filtering
         
         Returns:
-            GeoDataFrame containing roads data, or None if loading fails
+            Tuple of (infrastructure, population, roads) GeoDataFrames
         """
-        try:
-            # Load from cache or file
-            if self._roads_cache is None:
-                if not os.path.exists(self.roads_path):
-                    print(f"Warning: Roads data not found at {self.roads_path}")
-                    return self._create_sample_roads()
-                
-                self._roads_cache = gpd.read_file(self.roads_path)
-            
-            # Filter by location if needed
-            if location:
-                filtered_data = self._filter_by_location(
-                    self._roads_cache,
-                    location,
-                    radius_km=10
-                )
-                return filtered_data
-            
-            return self._roads_cache
-            
-        except Exception as e:
-            print(f"Error loading roads data: {e}")
-            return self._create_sample_roads()
+        infrastructure, population, roads = await asyncio.gather(
+            self.fetch_infrastructure(location),
+            self.fetch_population(location),
+            self.fetch_roads(location)
+        )
+        return infrastructure, population, roads
     
     def _filter_by_location(
         self, 
         gdf: gpd.GeoDataFrame, 
         location: Dict, 
-        radius_km: float
+        radius_km: float,
+        exact: bool = False
     ) -> gpd.GeoDataFrame:
         """
-        Filter GeoDataFrame to features within radius of location.
+        Filter GeoDataFrame to features near a location.
+        
+        By default this is a bounding-box test against the spatial index,
+        which may keep a few features just outside the radius near the box
+        corners. With exact=True the box candidates are refined: points by
+        haversine distance, other geometries against the search circle.
         
         Args:
             gdf: GeoDataFrame to filter
             location: Dictionary with 'lat' and 'lon' keys
             radius_km: Radius in kilometers
+            exact: Only keep features that intersect the circle itself
         
         Returns:
             Filtered GeoDataFrame
         """
-        from shapely.geometry import Point
-        
-        # Create point from location
-        point = Point(location['lon'], location['lat'])
+        lon, lat = float(location['lon']), float(location['lat'])
+        radius_km = float(radius_km)
         
-        # Calculate distance in degrees (rough approximation)
-        # 1 degree ≈ 111 km
-        radius_deg = radius_km / 111.0
+        # R-tree envelope overlap only; no GEOS predicate work
+        matches = gdf.sindex.query(shapely.box(*_search_bbox(lon, lat, radius_km)))
         
-        # Create buffer around point
-        buffer = point.buffer(radius_deg)
+        if exact and len(matches):
+            geoms = np.asarray(gdf.geometry.iloc[matches])
+            is_point = shapely.get_type_id(geoms) == shapely.GeometryType.POINT
+            keep = np.empty(len(matches), dtype=bool)
+            
+            # Points: great-circle distance from their coordinates in one numpy pass
+            points = geoms[is_point]
+            keep[is_point] = _haversine_km(
+                lat, lon, shapely.get_y(points), shapely.get_x(points)
+            ) <= radius_km
+            
+            # Lines and polygons: intersect with the (cached, prepared) search circle
+            if not is_point.all():
+                keep[~is_point] = shapely.intersects(
+                    geoms[~is_point], _search_area(lon, lat, radius_km)
+                )
+            
+            matches = matches[keep]
         
-        # Filter features that intersect with buffer
-        filtered = gdf[gdf.geometry.intersects(buffer)]
+        # Keep file order
+        matches.sort()
         
-        return filtered
+        return gdf.iloc[matches]
     
     def _create_sample_infrastructure(self) -> gpd.GeoDataFrame:
         """
         Create sample infrastructure data for Brampton.
         This is used as fallback when static files are not available.
+        The layer is built once on first use; treat it as read-only.
         """
-        from shapely.geometry import Point
-        
-        # Sample infrastructure locations in Brampton
-        data = {
-            'name': [
-                'Brampton City Hall',
-                'Peel Memorial Hospital',
-                'Fire Station 201',
-                'Fire Station 202',
-                'Water Treatment Plant',
-                'Emergency Operations Centre'
-            ],
-            'type': [
-                'government',
-                'hospital',
-                'fire_station',
-                'fire_station',
-                'water',
-                'emergency'
-            ],
-            'capacity': [500, 1200, 50, 50, 100000, 200],
-            'lat': [43.7315, 43.6832, 43.7412, 43.6892, 43.7156, 43.7285],
-            'lon': [-79.7624, -79.7645, -79.7892, -79.7234, -79.7845, -79.7534]
-        }
-        
-        # Create Point geometries
-        geometry = [Point(lon, lat) for lat, lon in zip(data['lat'], data['lon'])]
-        
-        # Remove lat/lon from data dict (they're now in geometry)
-        data.pop('lat')
-        data.pop('lon')
-        
-        # Create GeoDataFrame
-        gdf = gpd.GeoDataFrame(data, geometry=geometry, crs='EPSG:4326')
-        
-        return gdf
+        return _build_sample_infrastructure()
     
     def _create_sample_population(self) -> gpd.GeoDataFrame:
         """
         Create sample population data for Brampton.
         This is used as fallback when static files are not available.
+        The layer is built once on first use; treat it as read-only.
         """
-        from shapely.geometry import Polygon
-        
-        # Sample census tracts in Brampton with population data
-        data = {
-            'tract_id': ['BT001', 'BT002', 'BT003', 'BT004', 'BT005'],
-            'population': [8500, 12000, 9800, 11500, 7200],
-            'density': [3200, 4500, 3800, 4200, 2900],  # per sq km
-            'vulnerable_pop': [850, 1440, 980, 1380, 720],  # elderly/children
-            'area_km2': [2.66, 2.67, 2.58, 2.74, 2.48]
-        }
-        
-        # Create sample polygon geometries (small rectangles)
-        geometries = [
-            # Downtown Brampton
-            Polygon([
-                (-79.7700, 43.7250),
-                (-79.7550, 43.7250),
-                (-79.7550, 43.7350),
-                (-79.7700, 43.7350),
-                (-79.7700, 43.7250)
-            ]),
-            # North Brampton
-            Polygon([
-                (-79.7700, 43.7350),
-                (-79.7550, 43.7350),
-                (-79.7550, 43.7450),
-                (-79.7700, 43.7450),
-                (-79.7700, 43.7350)
-            ]),
-            # East Brampton
-            Polygon([
-                (-79.7550, 43.7250),
-                (-79.7400, 43.7250),
-                (-79.7400, 43.7350),
-                (-79.7550, 43.7350),
-                (-79.7550, 43.7250)
-            ]),
-            # West Brampton
-            Polygon([
-                (-79.7850, 43.7250),
-                (-79.7700, 43.7250),
-                (-79.7700, 43.7350),
-                (-79.7850, 43.7350),
-                (-79.7850, 43.7250)
-            ]),
-            # South Brampton
-            Polygon([
-                (-79.7700, 43.7150),
-                (-79.7550, 43.7150),
-                (-79.7550, 43.7250),
-                (-79.7700, 43.7250),
-                (-79.7700, 43.7150)
-            ])
-        ]
-        
-        # Create GeoDataFrame
-        gdf = gpd.GeoDataFrame(data, geometry=geometries, crs='EPSG:4326')
-        
-        return gdf
+        return _build_sample_population()
     
     def _create_sample_roads(self) -> gpd.GeoDataFrame:
         """
         Create sample roads data for Brampton.
         This is used as fallback when static files are not available.
+        The layer is built once on first use; treat it as read-only.
         """
-        from shapely.geometry import LineString
-        
-        # Sample major roads in Brampton
-        data = {
-            'name': [
-                'Queen Street',
-                'Main Street North',
-                'Bovaird Drive',
-                'Steeles Avenue',
-                'Highway 410'
-            ],
-            'road_class': [
-                'arterial',
-                'arterial',
-                'arterial',
-                'arterial',
-                'highway'
-            ],
-            'lanes': [4, 4, 4, 6, 8],
-            'capacity_vph': [2000, 2000, 2000, 3000, 6000]  # vehicles per hour
-        }
-        
-        # Create sample LineString geometries
-        geometries = [
-            # Queen Street (east-west)
-            LineString([
-                (-79.7850, 43.7300),
-                (-79.7400, 43.7300)
-            ]),
-            # Main Street (north-south)
-            LineString([
-                (-79.7625, 43.7150),
-                (-79.7625, 43.7450)
-            ]),
-            # Bovaird Drive (east-west)
-            LineString([
-                (-79.7850, 43.7400),
-                (-79.7400, 43.7400)
-            ]),
-            # Steeles Avenue (east-west)
-            LineString([
-                (-79.7850, 43.7150),
-                (-79.7400, 43.7150)
-            ]),
-            # Highway 410 (north-south)
-            LineString([
-                (-79.7500, 43.7100),
-                (-79.7500, 43.7500)
-            ])
-        ]
-        
-        # Create GeoDataFrame
-        gdf = gpd.GeoDataFrame(data, geometry=geometries, crs='EPSG:4326')
-        
-        return gdf
+        return _build_sample_roads()
     
     def clear_cache(self):
         """Clear cached data to force reload from files."""
-        self._infra_cache = None
-        self._pop_cache = None
-        self._roads_cache = None
\ No newline at end of file
+        self._caches.clear()
+
+
+@lru_cache(maxsize=1)
+def _build_sample_infrastructure() -> gpd.GeoDataFrame:
+    """Build the fallback infrastructure layer used when static files are missing."""
+    # Sample infrastructure locations in Brampton
+    data = {
+        'name': [
+            'Brampton City Hall',
+            'Peel Memorial Hospital',
+            'Fire Station 201',
+            'Fire Station 202',
+            'Water Treatment Plant',
+            'Emergency Operations Centre'
+        ],
+        'type': [
+            'government',
+            'hospital',
+            'fire_station',
+            'fire_station',
+            'water',
+            'emergency'
+        ],
+        'capacity': [500, 1200, 50, 50, 100000, 200],
+        'lat': [43.7315, 43.6832, 43.7412, 43.6892, 43.7156, 43.7285],
+        'lon': [-79.7624, -79.7645, -79.7892, -79.7234, -79.7845, -79.7534]
+    }
+    
+    # Create Point geometries in one vectorized call
+    geometry = shapely.points(np.asarray(data['lon']), np.asarray(data['lat']))
+    
+    # Remove lat/lon from data dict (they're now in geometry)
+    data.pop('lat')
+    data.pop('lon')
+    
+    # Create GeoDataFrame
+    gdf = gpd.GeoDataFrame(data, geometry=geometry, crs='EPSG:4326')
+    # Build the spatial index up front, like layers read from disk
+    _ = gdf.sindex
+    
+    return gdf
+
+
+@lru_cache(maxsize=1)
+def _build_sample_population() -> gpd.GeoDataFrame:
+    """Build the fallback population layer used when static files are missing."""
+    # Sample census tracts in Brampton with population data
+    data = {
+        'tract_id': ['BT001', 'BT002', 'BT003', 'BT004', 'BT005'],
+        'population': [8500, 12000, 9800, 11500, 7200],
+        'density': [3200, 4500, 3800, 4200, 2900],  # per sq km
+        'vulnerable_pop': [850, 1440, 980, 1380, 720],  # elderly/children
+        'area_km2': [2.66, 2.67, 2.58, 2.74, 2.48]
+    }
+    
+    # Create sample polygon geometries (small rectangles) as (n, 5, 2) rings
+    rings = np.array([
+        # Downtown Brampton
+        [
+            (-79.7700, 43.7250),
+            (-79.7550, 43.7250),
+            (-79.7550, 43.7350),
+            (-79.7700, 43.7350),
+            (-79.7700, 43.7250)
+        ],
+        # North Brampton
+        [
+            (-79.7700, 43.7350),
+            (-79.7550, 43.7350),
+            (-79.7550, 43.7450),
+            (-79.7700, 43.7450),
+            (-79.7700, 43.7350)
+        ],
+        # East Brampton
+        [
+            (-79.7550, 43.7250),
+            (-79.7400, 43.7250),
+            (-79.7400, 43.7350),
+            (-79.7550, 43.7350),
+            (-79.7550, 43.7250)
+        ],
+        # West Brampton
+        [
+            (-79.7850, 43.7250),
+            (-79.7700, 43.7250),
+            (-79.7700, 43.7350),
+            (-79.7850, 43.7350),
+            (-79.7850, 43.7250)
+        ],
+        # South Brampton
+        [
+            (-79.7700, 43.7150),
+            (-79.7550, 43.7150),
+            (-79.7550, 43.7250),
+            (-79.7700, 43.7250),
+            (-79.7700, 43.7150)
+        ]
+    ])
+    geometries = shapely.polygons(rings)
+    
+    # Create GeoDataFrame
+    gdf = gpd.GeoDataFrame(data, geometry=geometries, crs='EPSG:4326')
+    # Build the spatial index up front, like layers read from disk
+    _ = gdf.sindex
+    
+    return gdf
+
+
+@lru_cache(maxsize=1)
+def _build_sample_roads() -> gpd.GeoDataFrame:
+    """Build the fallback roads layer used when static files are missing."""
+    # Sample major roads in Brampton
+    data = {
+        'name': [
+            'Queen Street',
+            'Main Street North',
+            'Bovaird Drive',
+            'Steeles Avenue',
+            'Highway 410'
+        ],
+        'road_class': [
+            'arterial',
+            'arterial',
+            'arterial',
+            'arterial',
+            'highway'
+        ],
+        'lanes': [4, 4, 4, 6, 8],
+        'capacity_vph': [2000, 2000, 2000, 3000, 6000]  # vehicles per hour
+    }
+    
+    # Create sample LineString geometries from (n, 2, 2) coordinates
+    paths = np.array([
+        # Queen Street (east-west)
+        [
+            (-79.7850, 43.7300),
+            (-79.7400, 43.7300)
+        ],
+        # Main Street (north-south)
+        [
+            (-79.7625, 43.7150),
+            (-79.7625, 43.7450)
+        ],
+        # Bovaird Drive (east-west)
+        [
+            (-79.7850, 43.7400),
+            (-79.7400, 43.7400)
+        ],
+        # Steeles Avenue (east-west)
+        [
+            (-79.7850, 43.7150),
+            (-79.7400, 43.7150)
+        ],
+        # Highway 410 (north-south)
+        [
+            (-79.7500, 43.7100),
+            (-79.7500, 43.7500)
+        ]
+    ])
+    geometries = shapely.linestrings(paths)
+    
+    # Create GeoDataFrame
+    gdf = gpd.GeoDataFrame(data, geometry=geometries, crs='EPSG:4326')
+    # Build the spatial index up front, like layers read from disk
+    _ = gdf.sindex
+    
+    return gdf
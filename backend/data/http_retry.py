@@ -0,0 +1,147 @@
+"""
+Retries, circuit breaking and stale-cache fallback for upstream API calls
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+import aiohttp
+
+from .ttl_cache import TTLCache
+
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY_SECONDS = 0.2
+RETRY_MAX_DELAY_SECONDS = 2.0
+
+
+class UpstreamStatusError(Exception):
+    """Upstream API answered with a non-200 status"""
+
+    def __init__(self, status: int):
+        super().__init__(f"Upstream API returned HTTP {status}")
+        self.status = status
+
+    @property
+    def transient(self) -> bool:
+        return self.status >= 500 or self.status == 429
+
+
+class CircuitOpenError(UpstreamStatusError):
+    """
+    Upstream API is failing and no cached value is available.
+
+    Reported as a 503 so callers that handle UpstreamStatusError treat an
+    open circuit like any other upstream failure. It is never retried.
+    """
+
+    def __init__(self):
+        Exception.__init__(self, "Upstream API circuit is open")
+        self.status = 503
+
+    @property
+    def transient(self) -> bool:
+        return False
+
+
+class CircuitBreaker:
+    """
+    Stop calling an upstream after fail_max consecutive failures.
+
+    After reset_timeout seconds one trial call is let through; a success
+    closes the circuit, another failure re-opens it.
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        """Whether a call may be attempted right now"""
+        if self._opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self._opened_at >= self.reset_timeout:
+            # Half-open: let this one trial through and keep everyone else
+            # out until it reports back. One more failure trips it again.
+            self._opened_at = now
+            self._failures = self.fail_max - 1
+            return True
+        return False
+
+    def record_success(self):
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self):
+        self._failures += 1
+        if self._failures >= self.fail_max:
+            self._opened_at = time.monotonic()
+
+
+def _is_transient(exc: Exception) -> bool:
+    if isinstance(exc, UpstreamStatusError):
+        return exc.transient
+    return isinstance(exc, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+async def fetch_with_fallback(
+    request: Callable[[], Awaitable[Any]],
+    cache: TTLCache,
+    key: Hashable,
+    breaker: CircuitBreaker,
+    attempts: int = RETRY_ATTEMPTS,
+) -> Any:
+    """
+    Serve key from cache, otherwise call request() and cache its result.
+
+    Transient failures (connection errors, timeouts, 5xx/429) are retried
+    with exponential backoff. Once retries are exhausted, or while the
+    circuit is open, the last cached value is returned even if expired.
+    Other errors (e.g. a 401) are raised immediately.
+
+    Args:
+        request: Zero-argument callable returning a fresh awaitable per attempt
+        cache: Cache holding previous successful results
+        key: Cache key for this request
+        breaker: Circuit breaker for the upstream being called
+        attempts: Total attempts including the first
+
+    Returns:
+        The fresh, cached or stale value
+    """
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    if not breaker.allow():
+        stale = cache.get(key, allow_stale=True)
+        if stale is not None:
+            return stale
+        raise CircuitOpenError()
+
+    for attempt in range(attempts):
+        try:
+            value = await request()
+        except Exception as exc:
+            if not _is_transient(exc):
+                raise
+            if attempt + 1 < attempts:
+                await asyncio.sleep(min(RETRY_BASE_DELAY_SECONDS * 2 ** attempt, RETRY_MAX_DELAY_SECONDS))
+                continue
+
+            breaker.record_failure()
+            stale = cache.get(key, allow_stale=True)
+            if stale is not None:
+                return stale
+            raise
+
+        breaker.record_success()
+        cache.set(key, value)
+        return value
@@ -1,12 +1,54 @@
-import requests
-from typing import Dict, List
+import asyncio
+import aiohttp
+import io
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Union
 import os
 
+from .http_retry import CircuitBreaker, UpstreamStatusError, fetch_with_fallback
+from .ttl_cache import TTLCache, location_key
+
+
+# Columns converted to float; bright_ti4 is in Kelvin
+NUMERIC_FIELDS = frozenset(('latitude', 'longitude', 'bright_ti4'))
+
+REQUEST_TIMEOUT_SECONDS = 10
+
+# FIRMS near-real-time detections are published a few times a day
+FIRES_TTL_SECONDS = 6 * 3600
+
 
 class SatelliteClient:
     def __init__(self):
         self.firms_api_key = os.getenv('NASA_FIRMS_API_KEY')
         self.firms_url = "https://firms.modaps.eosdis.nasa.gov/api/area"
+        # One pooled session per event loop, created on first use there
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        # Parsed detections keyed by location rounded to ~1 km and day range
+        self._fires_cache = TTLCache(FIRES_TTL_SECONDS)
+        self._breaker = CircuitBreaker()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session for the running event loop"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            # Loops closed without aclose() took their connections with them
+            for other in list(self._sessions):
+                if other.is_closed():
+                    self._sessions.pop(other, None)
+            session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
+            )
+            self._sessions[loop] = session
+        return session
+    
+    async def aclose(self):
+        """Close the running event loop's pooled HTTP session"""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
     
     async def fetch_imagery(self, location: Dict, days: int = 7) -> Dict:
         """
@@ -32,15 +74,24 @@ class SatelliteClient:
         bbox = self._create_bbox(location, radius_km=50)
         url = f"{self.firms_url}/csv/{self.firms_api_key}/VIIRS_SNPP_NRT/{bbox}/{days}"
         
-        response = requests.get(url)
-        
-        if response.status_code == 200:
-            # Parse CSV
-            fires = self._parse_firms_csv(response.text)
-            return fires
-        else:
+        try:
+            return await fetch_with_fallback(
+                lambda: self._get_fires(url),
+                self._fires_cache,
+                (*location_key(location), days),
+                self._breaker
+            )
+        except UpstreamStatusError:
             return []
     
+    async def _get_fires(self, url: str) -> List[Dict]:
+        """Download and parse a FIRMS CSV, raising UpstreamStatusError on non-200"""
+        async with self._get_session().get(url) as response:
+            if response.status != 200:
+                raise UpstreamStatusError(response.status)
+            # Parse CSV
+            return self._parse_firms_csv(await response.read())
+    
     def _create_bbox(self, location: Dict, radius_km: float) -> str:
         """Create bounding box around location"""
         lat = location['lat']
@@ -55,26 +106,33 @@ class SatelliteClient:
         
         return f"{west},{south},{east},{north}"
 
-    def _parse_firms_csv(self, csv_text: str) -> List[Dict]:
-        """Simplified CSV parser for FIRMS data"""
-        fires = []
-        lines = csv_text.strip().split('\n')
-        if len(lines) < 2:
+    def _parse_firms_csv(self, csv_text: Union[str, bytes]) -> List[Dict]:
+        """Parse FIRMS CSV data (text or raw UTF-8 bytes) with pandas' C parser"""
+        if not csv_text.strip():
             return []
         
-        headers = lines[0].split(',')
-        for row in lines[1:]:
-            values = row.split(',')
-            try:
-                fire_data = dict(zip(headers, values))
-                # Convert key fields
-                fire_data['latitude'] = float(fire_data['latitude'])
-                fire_data['longitude'] = float(fire_data['longitude'])
-                fire_data['bright_ti4'] = float(fire_data['bright_ti4'])  # Kelvin
-                fires.append(fire_data)
-            except (ValueError, IndexError):
-                continue  # Skip bad rows
-        return fires
+        # Raw bytes go straight to the parser without decoding to a str first
+        if isinstance(csv_text, bytes):
+            buffer = io.BytesIO(csv_text)
+        else:
+            buffer = io.StringIO(csv_text)
+        
+        # Read everything as text so non-numeric columns (acq_date, etc.) are untouched
+        df = pd.read_csv(
+            buffer,
+            dtype=str,
+            keep_default_na=False,
+            on_bad_lines='skip'
+        )
+        if not NUMERIC_FIELDS.issubset(df.columns):
+            return []
+        
+        # Convert key fields, skipping bad rows
+        for field in NUMERIC_FIELDS:
+            df[field] = pd.to_numeric(df[field], errors='coerce')
+        df = df.dropna(subset=list(NUMERIC_FIELDS))
+        
+        return df.to_dict('records')
 
     def _calculate_fire_perimeter(self, fires: List[Dict]) -> Dict:
         """
@@ -84,11 +142,13 @@ class SatelliteClient:
         if not fires:
             return None
         
-        lats = [f['latitude'] for f in fires]
-        lons = [f['longitude'] for f in fires]
-        
-        min_lon, max_lon = min(lons), max(lons)
-        min_lat, max_lat = min(lats), max(lats)
+        # One (lon, lat) array; each bound is a single vectorized reduction
+        points = np.array(
+            [(f['longitude'], f['latitude']) for f in fires],
+            dtype=np.float64
+        )
+        min_lon, min_lat = points.min(axis=0).tolist()
+        max_lon, max_lat = points.max(axis=0).tolist()
         
         # Create GeoJSON Polygon coordinates
         coordinates = [[
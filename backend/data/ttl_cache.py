@@ -0,0 +1,62 @@
+"""
+Small in-memory TTL cache for external API responses
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Decimal places kept when keying on coordinates (~1 km)
+LOCATION_PRECISION = 2
+
+
+def location_key(location: Dict, precision: int = LOCATION_PRECISION) -> Tuple[float, float]:
+    """Round a {'lat', 'lon'} location so nearby requests share a cache entry"""
+    return round(float(location['lat']), precision), round(float(location['lon']), precision)
+
+
+class TTLCache:
+    """
+    LRU cache whose entries expire ttl_seconds after they were stored.
+
+    Values are deep-copied on the way in and out so callers can mutate
+    what they get back without corrupting the cached response.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, allow_stale: bool = False) -> Optional[Any]:
+        """
+        Return a copy of the cached value, or None if missing or expired.
+
+        Expired entries are kept until evicted so allow_stale=True can still
+        serve them when the upstream API is failing.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if not allow_stale and time.monotonic() >= expires_at:
+            return None
+
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Any):
+        """Store value under key, evicting the least recently used entry if full"""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached entry"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,11 +1,56 @@
-import requests
+import asyncio
+import aiohttp
 import os
-from typing import Dict
+from typing import Dict, Tuple
+
+from .http_retry import CircuitBreaker, UpstreamStatusError, fetch_with_fallback
+from .ttl_cache import TTLCache, location_key
+
+REQUEST_TIMEOUT_SECONDS = 10
+
+# OpenWeather refreshes current conditions roughly every 10 minutes
+CURRENT_TTL_SECONDS = 600
+FORECAST_TTL_SECONDS = 3600
 
 class WeatherClient:
     def __init__(self):
         self.api_key = os.getenv('OPENWEATHER_API_KEY')
         self.base_url = "https://api.openweathermap.org/data/2.5"
+        # One pooled session per event loop, created on first use there
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        # Responses keyed by location rounded to ~1 km
+        self._current_cache = TTLCache(CURRENT_TTL_SECONDS)
+        self._forecast_cache = TTLCache(FORECAST_TTL_SECONDS)
+        # Shared by both endpoints since they hit the same upstream
+        self._breaker = CircuitBreaker()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session for the running event loop"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            # Loops closed without aclose() took their connections with them
+            for other in list(self._sessions):
+                if other.is_closed():
+                    self._sessions.pop(other, None)
+            session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
+            )
+            self._sessions[loop] = session
+        return session
+    
+    async def aclose(self):
+        """Close the running event loop's pooled HTTP session"""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+    
+    async def _get_json(self, url: str, params: Dict) -> Dict:
+        """GET a JSON document, raising UpstreamStatusError on non-200"""
+        async with self._get_session().get(url, params=params) as response:
+            if response.status != 200:
+                raise UpstreamStatusError(response.status)
+            return await response.json()
     
     async def fetch_current(self, location: Dict) -> Dict:
         """Fetch current weather conditions"""
@@ -17,11 +62,15 @@ class WeatherClient:
             'units': 'metric'
         }
         
-        response = requests.get(url, params=params)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise Exception(f"Weather API error: {response.status_code}")
+        try:
+            return await fetch_with_fallback(
+                lambda: self._get_json(url, params),
+                self._current_cache,
+                location_key(location),
+                self._breaker
+            )
+        except UpstreamStatusError as e:
+            raise Exception(f"Weather API error: {e.status}")
     
     async def fetch_forecast(self, location: Dict) -> Dict:
         """Fetch weather forecast (next 6 hours)"""
@@ -34,8 +83,20 @@ class WeatherClient:
             'cnt': 2  # Next 6 hours (3-hour intervals)
         }
         
-        response = requests.get(url, params=params)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return {}
\ No newline at end of file
+        try:
+            return await fetch_with_fallback(
+                lambda: self._get_json(url, params),
+                self._forecast_cache,
+                location_key(location),
+                self._breaker
+            )
+        except UpstreamStatusError:
+            return {}
+    
+    async def fetch_all(self, location: Dict) -> Tuple[Dict, Dict]:
+        """Fetch current conditions and forecast concurrently"""
+        current, forecast = await asyncio.gather(
+            self.fetch_current(location),
+            self.fetch_forecast(location)
+        )
+        return current, forecast
@@ -1,125 +1,265 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import hashlib
 import os
-import uuid
-from datetime import datetime
-from typing import Any, Dict, Optional
+import re
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from datetime import datetime, timezone
+from secrets import token_hex
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple
 
 import aiohttp
 
-from data.geohub_client import GeoHubClient
-from data.satellite_client import SatelliteClient
-from data.weather_client import WeatherClient
-from agents.damage_assessment import DamageAssessmentAgent
-from agents.population_impact import PopulationImpactAgent
-from agents.prediction import PredictionAgent
-from agents.resource_allocation import ResourceAllocationAgent
-from agents.routing import RoutingAgent
-from scenarios.july_2020_fire import load_july_2020_scenario, is_july_2020_scenario
-from scenarios.march_2022_fire import load_march_2022_scenario, is_march_2022_scenario
-from utils.cached_loader import load_cached_july_2020, is_cached_data_available
-from utils.config import config
+from backend.data.geohub_client import GeoHubClient
+from backend.data.satellite_client import SatelliteClient
+from backend.data.weather_client import WeatherClient
+from backend.data.ttl_cache import TTLCache
+from backend.agents.damage_assessment import DamageAssessmentAgent
+from backend.agents.population_impact import PopulationImpactAgent
+from backend.agents.prediction import PredictionAgent
+from backend.agents.resource_allocation import ResourceAllocationAgent
+from backend.agents.routing import RoutingAgent
+from backend.scenarios.july_2020_fire import load_july_2020_scenario, is_july_2020_scenario
+from backend.scenarios.march_2022_fire import load_march_2022_scenario, is_march_2022_scenario
+from backend.utils.cached_loader import load_cached_july_2020, is_cached_data_available
+from backend.utils import json_codec
+from backend.utils.config import config
+from backend.utils.disaster_store import create_disaster_store
+
+# Section markers for each prompt format; re.split yields (name, body) pairs
+_STANDARD_SECTIONS_RE = re.compile(
+    r"### (EXECUTIVE SUMMARY|SITUATION OVERVIEW|COMMUNICATION TEMPLATES \((?:ENGLISH|PUNJABI|HINDI)\)) ###"
+)
+_JULY_SECTIONS_RE = re.compile(
+    r"===(EXECUTIVE_SUMMARY|SITUATION_OVERVIEW|COMMUNICATION_EN|COMMUNICATION_PA|COMMUNICATION_HI)==="
+)
+
+# Section header in either prompt format ("### NAME ###" or "===NAME===")
+_STREAM_HEADER_RE = re.compile(r"(?:###|===)\s*([A-Z][A-Z_ ()]*?)\s*(?:###|===)")
+
+# Retry policy for transient OpenRouter failures
+LLM_RETRY_ATTEMPTS = 3
+LLM_RETRY_BASE_DELAY_SECONDS = 0.5
+LLM_RETRY_MAX_DELAY_SECONDS = 10.0
+LLM_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# A streamed completion may run for minutes; only a stalled stream times out
+LLM_STREAM_READ_TIMEOUT_SECONDS = 60
+
+# Parsed LLM responses reused for identical agent outputs
+LLM_CACHE_TTL_SECONDS = 24 * 3600
+LLM_CACHE_LOCATION_PRECISION = 3  # decimal places (~110 m)
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+    """Backoff before the next LLM attempt, honouring a numeric Retry-After."""
+    delay = LLM_RETRY_BASE_DELAY_SECONDS * (2 ** attempt)
+    if retry_after:
+        try:
+            delay = max(delay, float(retry_after))
+        except ValueError:
+            pass  # HTTP-date form; keep the computed backoff
+    return min(delay, LLM_RETRY_MAX_DELAY_SECONDS)
+
+
+def _llm_cache_key(context: Dict[str, Any], is_july_2020: bool) -> str:
+    """Fingerprint of the prompt inputs, ignoring per-disaster IDs and timestamps."""
+    location = {
+        k: round(v, LLM_CACHE_LOCATION_PRECISION) if isinstance(v, float) else v
+        for k, v in (context.get("location") or {}).items()
+    }
+    canonical = json_codec.dumps(
+        [is_july_2020, context.get("disaster_type"), location, context.get("agent_outputs", {})],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class _LazyDict(MutableMapping):
+    """Mapping that builds each value from its factory on first access."""
+
+    def __init__(self, factories: Dict[str, Callable[[], Any]]):
+        self._factories = dict(factories)
+        self._instances: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._instances:
+            self._instances[key] = self._factories[key]()
+        return self._instances[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._instances[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._factories.pop(key, None)
+        self._instances.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._factories or key in self._instances
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._factories
+        yield from (key for key in self._instances if key not in self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories.keys() | self._instances.keys())
+
+    def loaded(self) -> Dict[str, Any]:
+        """Values that have been built so far, without building the rest."""
+        return dict(self._instances)
 
 
 class DisasterOrchestrator:
     """Coordinate data ingestion and analysis across all agents."""
 
     def __init__(self, socketio_instance: Any):
-        self.active_disasters: Dict[str, Dict[str, Any]] = {}
+        # Oldest disasters are evicted once MAX_ACTIVE_DISASTERS is exceeded
+        self.active_disasters: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self.socketio = socketio_instance
+        # Snapshots shared with other workers; None when running a single process
+        self._store = create_disaster_store(config.DISASTER_STORE_URL)
+
+        # Clients and agents are built on first use
+        self.data_clients = _LazyDict({
+            "satellite": SatelliteClient,
+            "weather": WeatherClient,
+            "geohub": GeoHubClient,
+        })
+
+        self.agents = _LazyDict({
+            "damage": DamageAssessmentAgent,
+            "population": PopulationImpactAgent,
+            "routing": RoutingAgent,
+            "resource": ResourceAllocationAgent,
+            "prediction": PredictionAgent,
+        })
+
+        # LLM HTTP session and concurrency limit per event loop. Disasters run
+        # on the shared async_runner loop, so its session is reused across them
+        self._http: Dict[asyncio.AbstractEventLoop, Tuple[aiohttp.ClientSession, asyncio.Semaphore]] = {}
+        self._llm_cache = TTLCache(LLM_CACHE_TTL_SECONDS, maxsize=128)
+
+        # OpenRouter settings are read once; headers stay None without an API key
+        self._llm_url = os.getenv("OPENROUTER_URL", "https://openrouter.ai/api/v1/chat/completions")
+        self._llm_model = os.getenv("OPENROUTER_MODEL", "anthropic/claude-3.5-sonnet")
+        api_key = os.getenv("OPENROUTER_API_KEY")
+        self._llm_headers: Optional[Dict[str, str]] = {
+            "Authorization": f"Bearer {api_key}",
+            "HTTP-Referer": "https://rapidresponseai.demo",
+            "X-Title": "RapidResponseAI",
+        } if api_key else None
+
+    def _get_session(self) -> Tuple[aiohttp.ClientSession, asyncio.Semaphore]:
+        """Return this loop's pooled LLM session and the semaphore bounding its calls."""
+        loop = asyncio.get_running_loop()
+        entry = self._http.get(loop)
+        if entry is None or entry[0].closed:
+            # Loops closed without aclose() took their connections with them
+            for other in list(self._http):
+                if other.is_closed():
+                    self._http.pop(other, None)
+            entry = (
+                aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=60),
+                    connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=75),
+                    headers={"Content-Type": "application/json", "Accept": "application/json"},
+                    json_serialize=json_codec.dumps,
+                ),
+                # asyncio primitives are loop-bound, so the cap is per loop too
+                asyncio.Semaphore(config.LLM_MAX_INFLIGHT),
+            )
+            self._http[loop] = entry
+        return entry
 
-        self.data_clients = {
-            "satellite": SatelliteClient(),
-            "weather": WeatherClient(),
-            "geohub": GeoHubClient(),
-        }
+    async def aclose(self) -> None:
+        """Close this loop's LLM session and the data clients' HTTP sessions."""
+        entry = self._http.pop(asyncio.get_running_loop(), None)
+        if entry is not None and not entry[0].closed:
+            await entry[0].close()
 
-        self.agents = {
-            "damage": DamageAssessmentAgent(),
-            "population": PopulationImpactAgent(),
-            "routing": RoutingAgent(),
-            "resource": ResourceAllocationAgent(),
-            "prediction": PredictionAgent(),
-        }
+        for client in self.data_clients.loaded().values():
+            close = getattr(client, "aclose", None)
+            if close is not None:
+                await close()
 
     def create_disaster(self, trigger_data: Dict[str, Any]) -> str:
         """Create new disaster event state."""
         disaster_type = trigger_data.get("type", "event").lower()
-        timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
-        unique_id = uuid.uuid4().hex[:8]
+        # One clock read for both the ID and created_at
+        now = datetime.now(timezone.utc)
+        timestamp = now.strftime("%Y%m%d-%H%M%S")
+        unique_id = token_hex(4)
         disaster_id = f"{disaster_type}-{timestamp}-{unique_id}"
 
-        self.active_disasters[disaster_id] = {
+        self.register_disaster(disaster_id, {
             "id": disaster_id,
             "type": trigger_data.get("type"),
             "location": trigger_data.get("location", {}),
             "status": "initializing",
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": now.isoformat(),
             "data": {},
             "agent_results": {},
             "plan": None,
             "trigger": trigger_data,
-        }
+        })
 
         self._emit("disaster_created", self.active_disasters[disaster_id], room=disaster_id)
         return disaster_id
 
+    def register_disaster(self, disaster_id: str, disaster: Dict[str, Any]) -> None:
+        """Store disaster state, evicting the oldest entries beyond the cap."""
+        self.active_disasters[disaster_id] = disaster
+        self.active_disasters.move_to_end(disaster_id)
+        self._persist(disaster)
+        while len(self.active_disasters) > config.MAX_ACTIVE_DISASTERS:
+            evicted_id, _ = self.active_disasters.popitem(last=False)
+            self._log(f"Evicted disaster {evicted_id} (limit {config.MAX_ACTIVE_DISASTERS})")
+
     def get_disaster(self, disaster_id: str) -> Optional[Dict[str, Any]]:
-        return self.active_disasters.get(disaster_id)
+        disaster = self.active_disasters.get(disaster_id)
+        if disaster is None and self._store is not None:
+            # Processed by another worker, or evicted from this one
+            disaster = self._store.get(disaster_id)
+        return disaster
 
     def get_plan(self, disaster_id: str) -> Optional[Dict[str, Any]]:
-        disaster = self.active_disasters.get(disaster_id)
+        disaster = self.get_disaster(disaster_id)
         return disaster.get("plan") if disaster else None
 
+    def _persist(self, disaster: Dict[str, Any]) -> None:
+        """Publish the disaster's current state to the shared store, if any."""
+        if self._store is not None:
+            self._store.put(disaster)
+
     async def process_disaster(self, disaster_id: str) -> Optional[Dict[str, Any]]:
         """Main processing pipeline - attempts agent processing first, falls back to cache on failure."""
         disaster = self.active_disasters.get(disaster_id)
         if not disaster:
             raise ValueError(f"Disaster '{disaster_id}' not found")
+        trigger = disaster.get('trigger', {})
 
         try:
             # Always attempt real agent processing first
             self._log("Starting agent processing pipeline...")
             disaster["status"] = "fetching_data"
-            self._emit("disaster_status", {"status": "fetching_data"}, room=disaster_id)
-            self._emit(
-                "progress",
-                {
-                    "disaster_id": disaster_id,
-                    "phase": "data_ingestion",
-                    "progress": 10,
-                },
-                room=disaster_id,
-            )
-
-            # Check if this is July 2020 scenario
-            if is_july_2020_scenario(disaster.get('trigger', {})):
-                self._log("Loading July 2020 scenario configuration")
-                scenario_config = load_july_2020_scenario()
+            self._emit_phase(disaster_id, "fetching_data", "data_ingestion", 10)
 
-                # Store scenario config for reference
-                disaster['scenario_config'] = scenario_config
-
-                # Use scenario data instead of fetching
-                data = {
-                    'weather_current': scenario_config['weather'],
-                    'weather_forecast': scenario_config['weather'],
-                    'satellite': None,  # Will use fire_perimeter directly
-                    'population': scenario_config['population_estimate'],
-                    'infrastructure': scenario_config['infrastructure'],
-                    'roads': None,  # Will fetch this normally
-                }
-
-                # Add fire perimeter to disaster data for agents
-                disaster['fire_perimeter'] = scenario_config['fire_perimeter']
+            # Historical scenarios supply their own inputs instead of fetching
+            if is_july_2020_scenario(trigger):
+                scenario_name, load_scenario = "July 2020", load_july_2020_scenario
+            elif is_march_2022_scenario(trigger):
+                scenario_name, load_scenario = "March 2022", load_march_2022_scenario
+            else:
+                scenario_name, load_scenario = None, None
 
-                self._log(f"July 2020 scenario loaded: {scenario_config['disaster']['name']}")
-            # Check if this is March 2022 scenario
-            elif is_march_2022_scenario(disaster.get('trigger', {})):
-                self._log("Loading March 2022 scenario configuration")
-                scenario_config = load_march_2022_scenario()
+            if load_scenario is not None:
+                self._log(f"Loading {scenario_name} scenario configuration")
+                scenario_config = load_scenario()
 
                 # Store scenario config for reference
                 disaster['scenario_config'] = scenario_config
@@ -137,37 +277,19 @@ class DisasterOrchestrator:
                 # Add fire perimeter to disaster data for agents
                 disaster['fire_perimeter'] = scenario_config['fire_perimeter']
 
-                self._log(f"March 2022 scenario loaded: {scenario_config['disaster']['name']}")
+                self._log(f"{scenario_name} scenario loaded: {scenario_config['disaster']['name']}")
             else:
                 data = await self._fetch_all_data(disaster)
 
             disaster["data"] = data
 
             disaster["status"] = "analyzing"
-            self._emit("disaster_status", {"status": "analyzing"}, room=disaster_id)
-            self._emit(
-                "progress",
-                {
-                    "disaster_id": disaster_id,
-                    "phase": "agent_processing",
-                    "progress": 30,
-                },
-                room=disaster_id,
-            )
+            self._emit_phase(disaster_id, "analyzing", "agent_processing", 30)
             agent_results = await self._run_all_agents(disaster, data)
             disaster["agent_results"] = agent_results
 
             disaster["status"] = "generating_plan"
-            self._emit("disaster_status", {"status": "generating_plan"}, room=disaster_id)
-            self._emit(
-                "progress",
-                {
-                    "disaster_id": disaster_id,
-                    "phase": "synthesis",
-                    "progress": 70,
-                },
-                room=disaster_id,
-            )
+            self._emit_phase(disaster_id, "generating_plan", "synthesis", 70)
 
             context = {
                 "disaster_type": disaster.get("type"),
@@ -193,6 +315,9 @@ class DisasterOrchestrator:
 
             disaster["plan"] = final_plan
             disaster["status"] = "complete"
+            # Raw inputs (GIS frames, fire points) are only needed to build the plan
+            disaster["data"] = {}
+            self._persist(disaster)
 
             self._emit(
                 "disaster_complete",
@@ -206,7 +331,7 @@ class DisasterOrchestrator:
             self._log(f"❌ Agent processing failed: {exc}")
             
             # Check if we can use cached data as fallback
-            if is_july_2020_scenario(disaster.get('trigger', {})) and is_cached_data_available():
+            if is_july_2020_scenario(trigger) and is_cached_data_available():
                 self._log("⚠️ Agent processing failed - falling back to cached data")
                 try:
                     await self._load_cached_response(disaster_id, is_fallback=True)
@@ -217,6 +342,7 @@ class DisasterOrchestrator:
                     # Both real processing and cache failed - propagate original error
                     disaster["status"] = "error"
                     disaster["error"] = f"Agent processing failed: {exc}. Cache fallback failed: {cache_exc}"
+                    self._persist(disaster)
                     self._emit(
                         "disaster_error",
                         {"disaster_id": disaster_id, "error": disaster["error"]},
@@ -228,6 +354,7 @@ class DisasterOrchestrator:
                 self._log("❌ No cached fallback available")
                 disaster["status"] = "error"
                 disaster["error"] = str(exc)
+                self._persist(disaster)
                 self._emit(
                     "disaster_error",
                     {"disaster_id": disaster_id, "error": str(exc)},
@@ -255,52 +382,38 @@ class DisasterOrchestrator:
              self.data_clients["geohub"].fetch_roads(location)),
         ]
 
-        results: Dict[str, Any] = {}
-        
-        for key, description, progress_pct, coro in fetch_sequence:
+        # Announce every source in one event, then fetch them all concurrently
+        start_pct = fetch_sequence[0][2]
+        self._emit(
+            "progress",
+            {
+                "disaster_id": disaster_id,
+                "phase": "data_ingestion",
+                "progress": start_pct,
+                "message": f"📡 Fetching {len(fetch_sequence)} data sources...",
+                "api_statuses": [
+                    {"name": description, "status": "fetching"}
+                    for _, description, _, _ in fetch_sequence
+                ],
+            },
+            room=disaster_id,
+        )
+
+        # Report each source as soon as it lands; the n-th arrival takes the
+        # n-th progress step whichever source it is
+        steps = iter([progress_pct + 1 for _, _, progress_pct, _ in fetch_sequence])
+
+        async def _fetch_one(key: str, description: str, coro: Awaitable[Any]) -> Tuple[str, Any]:
             try:
-                self._emit(
-                    "progress",
-                    {
-                        "disaster_id": disaster_id,
-                        "phase": "data_ingestion",
-                        "progress": progress_pct,
-                        "message": f"📡 Fetching {description}...",
-                        "api_status": {
-                            "name": description,
-                            "status": "fetching"
-                        }
-                    },
-                    room=disaster_id,
-                )
-                
-                results[key] = await coro
-                
-                self._emit(
-                    "progress",
-                    {
-                        "disaster_id": disaster_id,
-                        "phase": "data_ingestion",
-                        "progress": progress_pct + 1,
-                        "message": f"✅ {description} received",
-                        "api_status": {
-                            "name": description,
-                            "status": "success"
-                        }
-                    },
-                    room=disaster_id,
-                )
-                
+                value = await coro
             except Exception as exc:
-                results[key] = None
                 self._log(f"Failed to fetch {key} data: {exc}")
-                
                 self._emit(
                     "progress",
                     {
                         "disaster_id": disaster_id,
                         "phase": "data_ingestion",
-                        "progress": progress_pct + 1,
+                        "progress": next(steps),
                         "message": f"⚠️ {description} unavailable (using fallback)",
                         "api_status": {
                             "name": description,
@@ -310,8 +423,28 @@ class DisasterOrchestrator:
                     },
                     room=disaster_id,
                 )
-                
-        return results
+                return key, None
+
+            self._emit(
+                "progress",
+                {
+                    "disaster_id": disaster_id,
+                    "phase": "data_ingestion",
+                    "progress": next(steps),
+                    "message": f"✅ {description} received",
+                    "api_status": {
+                        "name": description,
+                        "status": "success"
+                    }
+                },
+                room=disaster_id,
+            )
+            return key, value
+
+        pairs = await asyncio.gather(
+            *(_fetch_one(key, description, coro) for key, description, _, coro in fetch_sequence)
+        )
+        return dict(pairs)
 
     async def _run_all_agents(
         self,
@@ -319,7 +452,9 @@ class DisasterOrchestrator:
         data: Dict[str, Any],
     ) -> Dict[str, Any]:
         disaster_id = disaster.get("id")
-        
+        disaster_type = disaster.get("type", "unknown")
+        location = disaster.get("location")
+
         # Agent 1: Damage Assessment
         self._emit(
             "progress",
@@ -333,85 +468,90 @@ class DisasterOrchestrator:
         )
         damage_result = await self.agents["damage"].analyze(
             data.get("satellite"),
-            disaster.get("type", "unknown"),
-            disaster_location=disaster.get("location"),
+            disaster_type,
+            disaster_location=location,
         )
 
-        # Agent 2: Population Impact
+        # Agents 2, 3 and 5 only depend on the damage assessment, so run them together
         self._emit(
             "progress",
             {
                 "disaster_id": disaster_id,
                 "phase": "agent_processing",
                 "progress": 45,
-                "message": "👥 Agent 2/5: Calculating population impact...",
-            },
-            room=disaster_id,
-        )
-        population_result = await self.agents["population"].analyze(
-            damage_result.get("fire_perimeter"),
-            data.get("population"),
-        )
-
-        # Agent 3: Evacuation Routing
-        self._emit(
-            "progress",
-            {
-                "disaster_id": disaster_id,
-                "phase": "agent_processing",
-                "progress": 55,
-                "message": "🚗 Agent 3/5: Planning evacuation routes...",
-            },
-            room=disaster_id,
-        )
-        routing_result = await self.agents["routing"].analyze(
-            data.get("roads"),
-            data.get("infrastructure"),
-            damage_result,
-            disaster_location=disaster.get("location"),
-        )
-
-        # Agent 4: Resource Allocation
-        self._emit(
-            "progress",
-            {
-                "disaster_id": disaster_id,
-                "phase": "agent_processing",
-                "progress": 65,
-                "message": "🚒 Agent 4/5: Allocating emergency resources...",
-            },
-            room=disaster_id,
-        )
-        resource_result = await self.agents["resource"].analyze(
-            population_result,
-            routing_result,
-            data.get("infrastructure"),
-        )
-
-        # Agent 5: Prediction & Timeline
-        self._emit(
-            "progress",
-            {
-                "disaster_id": disaster_id,
-                "phase": "agent_processing",
-                "progress": 75,
-                "message": "📊 Agent 5/5: Predicting fire spread timeline...",
+                "message": (
+                    "👥🚗📊 Agents 2, 3 & 5/5: Calculating population impact, "
+                    "planning evacuation routes and predicting fire spread..."
+                ),
             },
             room=disaster_id,
         )
         prediction_context = {
-            "type": disaster.get("type", "unknown"),
-            "location": disaster.get("location", {}),
+            "type": disaster_type,
+            "location": location or {},
         }
         prediction_inputs = {
             "weather": data.get("weather_forecast") or {},
             "fire_perimeter": damage_result.get("fire_perimeter"),
         }
 
-        prediction_result = await self.agents["prediction"].analyze(
-            prediction_context,
-            prediction_inputs,
+        # The CPU-bound agents run their synchronous analyze_sync on worker
+        # threads so they overlap instead of running back to back on the loop
+        async def allocate_resources():
+            # Let both agents finish before surfacing the first failure
+            wave_results = await asyncio.gather(
+                asyncio.to_thread(
+                    self.agents["population"].analyze_sync,
+                    damage_result.get("fire_perimeter"),
+                    data.get("population"),
+                ),
+                asyncio.to_thread(
+                    self.agents["routing"].analyze_sync,
+                    data.get("roads"),
+                    data.get("infrastructure"),
+                    damage_result,
+                    disaster_location=location,
+                ),
+                return_exceptions=True,
+            )
+            for result in wave_results:
+                if isinstance(result, BaseException):
+                    raise result
+            population_result, routing_result = wave_results
+
+            # Agent 4: Resource Allocation (needs population and routing)
+            self._emit(
+                "progress",
+                {
+                    "disaster_id": disaster_id,
+                    "phase": "agent_processing",
+                    "progress": 65,
+                    "message": "🚒 Agent 4/5: Allocating emergency resources...",
+                },
+                room=disaster_id,
+            )
+            resource_result = await asyncio.to_thread(
+                self.agents["resource"].analyze_sync,
+                population_result,
+                routing_result,
+                data.get("infrastructure"),
+            )
+            return population_result, routing_result, resource_result
+
+        # Prediction keeps running alongside the population -> resource chain
+        chain_result, prediction_result = await asyncio.gather(
+            allocate_resources(),
+            asyncio.to_thread(
+                self.agents["prediction"].analyze_sync,
+                prediction_context,
+                prediction_inputs,
+            ),
+            return_exceptions=True,
         )
+        for result in (chain_result, prediction_result):
+            if isinstance(result, BaseException):
+                raise result
+        population_result, routing_result, resource_result = chain_result
 
         return {
             "damage": damage_result,
@@ -424,11 +564,11 @@ class DisasterOrchestrator:
     def create_standard_prompt(self, context: Dict[str, Any]) -> str:
         """Build the standard prompt for the LLM synthesis step."""
         agent_results = context.get("agent_outputs", {})
-        damage_data = json.dumps(agent_results.get("damage", {}), indent=2)
-        population_data = json.dumps(agent_results.get("population", {}), indent=2)
-        prediction_data = json.dumps(agent_results.get("prediction", {}), indent=2)
-        routing_data = json.dumps(agent_results.get("routing", {}), indent=2)
-        resource_data = json.dumps(agent_results.get("resource", {}), indent=2)
+        damage_data = json_codec.dumps(agent_results.get("damage", {}), indent=2)
+        population_data = json_codec.dumps(agent_results.get("population", {}), indent=2)
+        prediction_data = json_codec.dumps(agent_results.get("prediction", {}), indent=2)
+        routing_data = json_codec.dumps(agent_results.get("routing", {}), indent=2)
+        resource_data = json_codec.dumps(agent_results.get("resource", {}), indent=2)
 
         disaster_type = context.get("disaster_type", "unknown incident")
         location_obj = context.get("location", {})
@@ -532,7 +672,7 @@ SITUATION:
 This is a WILDLAND-URBAN INTERFACE (WUI) FIRE at the Highway 407/410 interchange.
 
 CRITICAL CONTEXT:
-{json.dumps(agent_outputs, indent=2)}
+{json_codec.dumps(agent_outputs, indent=2)}
 
 MANDATORY QUANTITATIVE REQUIREMENTS:
 You MUST include specific numbers for ALL metrics. Generate realistic estimates if data is sparse:
@@ -604,17 +744,15 @@ Remember: Lives depend on this plan. Be specific, quantitative, urgent, and acti
 
         return prompt
 
-    def _extract_section(self, text: str, start_delim: str, end_delim: str) -> str:
-        """Helper to extract text between two delimiters."""
-        try:
-            start_index = text.index(start_delim) + len(start_delim)
-            end_index = text.index(end_delim, start_index)
-            return text[start_index:end_index].strip()
-        except ValueError:
-            if start_delim in text:
-                return text.split(start_delim, 1)[-1].split("###", 1)[0].strip()
-            self._log(f"Warning: Could not find delimiter {start_delim}")
-            return f"Error: Could not find section {start_delim}"
+    @staticmethod
+    def _split_sections(pattern: re.Pattern, text: str) -> Dict[str, str]:
+        """Map each section marker to the stripped text up to the next marker."""
+        parts = pattern.split(text)
+        sections: Dict[str, str] = {}
+        # parts = [preamble, name1, body1, name2, body2, ...]; first occurrence wins
+        for name, body in zip(parts[1::2], parts[2::2]):
+            sections.setdefault(name, body.strip())
+        return sections
 
     def _parse_llm_response(self, response_text: str, is_july_2020: bool = False) -> Dict[str, Any]:
         """Parses the raw LLM text block into a structured dict."""
@@ -622,99 +760,45 @@ Remember: Lives depend on this plan. Be specific, quantitative, urgent, and acti
 
         if is_july_2020:
             # Parse July 2020 format with === delimiters
-            sections = {}
+            sections = self._split_sections(_JULY_SECTIONS_RE, response_text)
 
-            # Extract executive summary
-            if '===EXECUTIVE_SUMMARY===' in response_text:
-                start = response_text.index('===EXECUTIVE_SUMMARY===') + len('===EXECUTIVE_SUMMARY===')
-                end = response_text.index('===SITUATION_OVERVIEW===', start)
-                sections['summary'] = response_text[start:end].strip()
-            else:
-                sections['summary'] = "Error: Could not parse executive summary."
-
-            # Extract situation overview
-            if '===SITUATION_OVERVIEW===' in response_text:
-                start = response_text.index('===SITUATION_OVERVIEW===') + len('===SITUATION_OVERVIEW===')
-                end = response_text.index('===COMMUNICATION_EN===', start)
-                sections['overview'] = response_text[start:end].strip()
-            else:
-                sections['overview'] = "Error: Could not parse situation overview."
-
-            # Extract communication templates
-            templates = {}
-
-            if '===COMMUNICATION_EN===' in response_text:
-                start = response_text.index('===COMMUNICATION_EN===') + len('===COMMUNICATION_EN===')
-                end = response_text.index('===COMMUNICATION_PA===', start)
-                templates['en'] = response_text[start:end].strip()
-            else:
-                templates['en'] = "Error: Could not parse English template."
-
-            if '===COMMUNICATION_PA===' in response_text:
-                start = response_text.index('===COMMUNICATION_PA===') + len('===COMMUNICATION_PA===')
-                end = response_text.index('===COMMUNICATION_HI===', start)
-                templates['pa'] = response_text[start:end].strip()
-            else:
-                templates['pa'] = "Error: Could not parse Punjabi template."
-
-            if '===COMMUNICATION_HI===' in response_text:
-                start = response_text.index('===COMMUNICATION_HI===') + len('===COMMUNICATION_HI===')
-                # Find end (either next === or end of string)
-                next_marker = response_text.find('===', start)
-                if next_marker == -1:
-                    templates['hi'] = response_text[start:].strip()
-                else:
-                    templates['hi'] = response_text[start:next_marker].strip()
-            else:
-                templates['hi'] = "Error: Could not parse Hindi template."
-
-            sections['templates'] = templates
-            return sections
-        else:
-            # Parse standard format with ### delimiters
-            summary = self._extract_section(
-                response_text,
-                "### EXECUTIVE SUMMARY ###",
-                "### SITUATION OVERVIEW ###",
-            )
-            overview = self._extract_section(
-                response_text,
-                "### SITUATION OVERVIEW ###",
-                "### COMMUNICATION TEMPLATES (ENGLISH) ###",
-            )
-
-            template_en = self._extract_section(
-                response_text,
-                "### COMMUNICATION TEMPLATES (ENGLISH) ###",
-                "### COMMUNICATION TEMPLATES (PUNJABI) ###",
-            )
-            template_pa = self._extract_section(
-                response_text,
-                "### COMMUNICATION TEMPLATES (PUNJABI) ###",
-                "### COMMUNICATION TEMPLATES (HINDI) ###",
-            )
-
-            try:
-                template_hi = response_text.split("### COMMUNICATION TEMPLATES (HINDI) ###", 1)[
-                    -1
-                ].strip()
-            except Exception:
-                template_hi = "Error: Could not parse Hindi template."
+            # Anything after the Hindi template that starts a new === block is dropped
+            template_hi = sections.get("COMMUNICATION_HI")
+            if template_hi is not None:
+                template_hi = template_hi.split("===", 1)[0].strip()
 
             return {
-                "summary": summary,
-                "overview": overview,
+                "summary": sections.get("EXECUTIVE_SUMMARY", "Error: Could not parse executive summary."),
+                "overview": sections.get("SITUATION_OVERVIEW", "Error: Could not parse situation overview."),
                 "templates": {
-                    "en": template_en,
-                    "pa": template_pa,
-                    "hi": template_hi,
+                    "en": sections.get("COMMUNICATION_EN", "Error: Could not parse English template."),
+                    "pa": sections.get("COMMUNICATION_PA", "Error: Could not parse Punjabi template."),
+                    "hi": template_hi if template_hi is not None else "Error: Could not parse Hindi template.",
                 },
             }
 
+        # Parse standard format with ### delimiters
+        sections = self._split_sections(_STANDARD_SECTIONS_RE, response_text)
+
+        def section(name: str) -> str:
+            if name in sections:
+                return sections[name]
+            self._log(f"Warning: Could not find delimiter ### {name} ###")
+            return f"Error: Could not find section ### {name} ###"
+
+        return {
+            "summary": section("EXECUTIVE SUMMARY"),
+            "overview": section("SITUATION OVERVIEW"),
+            "templates": {
+                "en": section("COMMUNICATION TEMPLATES (ENGLISH)"),
+                "pa": section("COMMUNICATION TEMPLATES (PUNJABI)"),
+                "hi": section("COMMUNICATION TEMPLATES (HINDI)"),
+            },
+        }
+
     async def _call_llm_api(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Send the synthesized prompt to the LLM provider and parse the response."""
-        api_key = os.getenv("OPENROUTER_API_KEY")
-        if not api_key:
+        if self._llm_headers is None:
             self._log("OPENROUTER_API_KEY not configured; returning fallback plan.")
             return {
                 "summary": "Error: LLM API key not configured.",
@@ -749,24 +833,39 @@ Remember: Lives depend on this plan. Be specific, quantitative, urgent, and acti
         
         is_july_2020 = metadata.get('scenario') == 'july_2020_backtest'
 
+        # Identical agent outputs produce the same plan; skip the round trip
+        cache_key = await asyncio.to_thread(_llm_cache_key, context, is_july_2020)
+        cached = self._llm_cache.get(cache_key)
+        if cached is not None:
+            self._log("Reusing cached LLM response")
+            if disaster_id:
+                self._emit(
+                    "progress",
+                    {
+                        "disaster_id": disaster_id,
+                        "phase": "synthesis",
+                        "progress": 95,
+                        "message": "✅ AI-generated emergency plan reused",
+                        "api_status": {
+                            "name": "OpenRouter LLM",
+                            "status": "success"
+                        }
+                    },
+                    room=disaster_id,
+                )
+            return cached
+
         if is_july_2020:
             self._log("Using July 2020 specialized prompt (HWY 407 emphasis)")
-            prompt = self.create_july_2020_prompt(context)
+            build_prompt = self.create_july_2020_prompt
         else:
             self._log("Using standard prompt")
-            prompt = self.create_standard_prompt(context)
-
-        url = os.getenv("OPENROUTER_URL", "https://openrouter.ai/api/v1/chat/completions")
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "HTTP-Referer": "https://rapidresponseai.demo",
-            "X-Title": "RapidResponseAI",
-        }
+            build_prompt = self.create_standard_prompt
+        # Serializing the agent outputs is CPU-bound; keep it off the event loop
+        prompt = await asyncio.to_thread(build_prompt, context)
 
         payload = {
-            "model": os.getenv("OPENROUTER_MODEL", "anthropic/claude-3.5-sonnet"),
+            "model": self._llm_model,
             "messages": [
                 {
                     "role": "user",
@@ -775,21 +874,45 @@ Remember: Lives depend on this plan. Be specific, quantitative, urgent, and acti
             ],
             "temperature": 0.7,
             "max_tokens": 2000,
+            # Sections are forwarded to the client as they finish streaming
+            "stream": True,
         }
 
-        timeout = aiohttp.ClientTimeout(total=60)
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(url, headers=headers, json=payload) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        self._log(f"LLM API error {response.status}: {error_text}")
-                        return {
-                            "summary": f"Error: LLM API request failed ({response.status}).",
-                            "overview": error_text,
-                            "templates": {},
-                        }
-                    data = await response.json()
+            session, semaphore = self._get_session()
+            timeout = aiohttp.ClientTimeout(total=None, sock_read=LLM_STREAM_READ_TIMEOUT_SECONDS)
+            async with semaphore:
+                for attempt in range(LLM_RETRY_ATTEMPTS):
+                    retry_after = None
+                    try:
+                        async with session.post(
+                            self._llm_url, headers=self._llm_headers, json=payload, timeout=timeout
+                        ) as response:
+                            retryable = response.status in LLM_RETRY_STATUSES and attempt + 1 < LLM_RETRY_ATTEMPTS
+                            if retryable:
+                                retry_after = response.headers.get("Retry-After")
+                                self._log(f"LLM API returned {response.status}, retrying")
+                            elif response.status != 200:
+                                error_text = await response.text()
+                                self._log(f"LLM API error {response.status}: {error_text}")
+                                return {
+                                    "summary": f"Error: LLM API request failed ({response.status}).",
+                                    "overview": error_text,
+                                    "templates": {},
+                                }
+                            elif response.content_type == "text/event-stream":
+                                streamed = await self._read_llm_stream(response, disaster_id)
+                                choices = [{"message": {"content": streamed}}]
+                                break
+                            else:
+                                choices = json_codec.loads(await response.read()).get("choices", [])
+                                break
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                        if attempt + 1 == LLM_RETRY_ATTEMPTS:
+                            raise
+                        self._log(f"LLM API transient error ({exc!r}), retrying")
+
+                    await asyncio.sleep(_retry_delay(attempt, retry_after))
         except Exception as exc:
             self._log(f"LLM API exception: {exc}")
             return {
@@ -798,7 +921,6 @@ Remember: Lives depend on this plan. Be specific, quantitative, urgent, and acti
                 "templates": {},
             }
 
-        choices = data.get("choices", [])
         if not choices:
             self._log("LLM API response missing choices array.")
             return {
@@ -835,7 +957,71 @@ Remember: Lives depend on this plan. Be specific, quantitative, urgent, and acti
                 room=disaster_id,
             )
 
-        return self._parse_llm_response(content or "", is_july_2020=is_july_2020)
+        parsed = self._parse_llm_response(content or "", is_july_2020=is_july_2020)
+        if not parsed["summary"].startswith("Error:"):
+            self._llm_cache.set(cache_key, parsed)
+        return parsed
+
+    async def _read_llm_stream(self, response: aiohttp.ClientResponse, disaster_id: Optional[str]) -> str:
+        """Accumulate a streamed completion, emitting each plan section once it closes.
+
+        If the stream breaks after sections went out, a plan_partial_reset event
+        tells the client to discard them before the request is retried.
+        """
+        text = ""
+        section: Optional[re.Match] = None
+        scan_from = 0
+        emitted = False
+
+        def emit_section(end: int) -> None:
+            nonlocal emitted
+            if section is None or not disaster_id:
+                return
+            self._emit(
+                "plan_partial",
+                {
+                    "disaster_id": disaster_id,
+                    "section": section.group(1),
+                    "content": text[section.end():end].strip(),
+                },
+                room=disaster_id,
+            )
+            emitted = True
+
+        try:
+            async for raw_line in response.content:
+                line = raw_line.decode("utf-8").strip()
+                # Skip blank event separators and ": keep-alive" comments
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+
+                event = json_codec.loads(data)
+                if "error" in event:
+                    error = event["error"]
+                    raise Exception(error.get("message", error) if isinstance(error, dict) else error)
+
+                choices = event.get("choices") or [{}]
+                delta = (choices[0].get("delta") or {}).get("content")
+                if not delta:
+                    continue
+                text += delta
+
+                # A new header closes the section before it
+                for header in _STREAM_HEADER_RE.finditer(text, scan_from):
+                    emit_section(header.start())
+                    section = header
+                    scan_from = header.end()
+        except BaseException:
+            if emitted:
+                self._emit("plan_partial_reset", {"disaster_id": disaster_id}, room=disaster_id)
+            raise
+
+        # The end of the stream closes the last section
+        emit_section(len(text))
+        return text
 
     async def _load_cached_response(self, disaster_id: str, is_fallback: bool = False):
         """Load cached response as fallback when agent processing fails"""
@@ -871,6 +1057,7 @@ Remember: Lives depend on this plan. Be specific, quantitative, urgent, and acti
         if is_fallback:
             disaster['plan']['_source'] = 'cached_fallback'
             disaster['plan']['_note'] = 'Agent processing failed, using cached data'
+        self._persist(disaster)
 
         # Emit completion
         self._emit('disaster_complete', {
@@ -880,6 +1067,22 @@ Remember: Lives depend on this plan. Be specific, quantitative, urgent, and acti
 
         self._log(f"Cached response loaded as {'fallback' if is_fallback else 'demo'}")
 
+    def _emit_phase(self, disaster_id: str, status: str, phase: str, progress: int) -> None:
+        """Announce a pipeline phase change as one progress event carrying the status."""
+        disaster = self.active_disasters.get(disaster_id)
+        if disaster is not None:
+            self._persist(disaster)
+        self._emit(
+            "progress",
+            {
+                "disaster_id": disaster_id,
+                "status": status,
+                "phase": phase,
+                "progress": progress,
+            },
+            room=disaster_id,
+        )
+
     def _emit(self, event: str, payload: Dict[str, Any], room: Optional[str] = None) -> None:
         if self.socketio:
             self.socketio.emit(event, payload, room=room)
@@ -1,14 +1,18 @@
 from flask import Blueprint, jsonify, request
-from data.satellite_client import SatelliteClient
-from data.weather_client import WeatherClient
-from utils.config import config
-from utils.cached_loader import is_cached_data_available
-import asyncio
-import uuid
+from backend.data.satellite_client import SatelliteClient
+from backend.data.weather_client import WeatherClient
+from backend.utils.config import config
+from backend.utils.cached_loader import is_cached_data_available
+from backend.utils.async_runner import run_async
+from secrets import token_hex
 
 def create_routes(orchestrator):
     main_bp = Blueprint('main', __name__)
 
+    # Shared per worker so the test endpoints reuse client state between requests
+    satellite_client = SatelliteClient()
+    weather_client = WeatherClient()
+
     @main_bp.route('/health', methods=['GET'])
     def health_check():
         return jsonify({"status": "healthy", "message": "Backend is running"})
@@ -31,12 +35,12 @@ def create_routes(orchestrator):
 
             # Generate disaster ID based on scenario
             if is_july_2020:
-                disaster_id = f"wildfire-july-2020-{uuid.uuid4().hex[:8]}"
+                disaster_id = f"wildfire-july-2020-{token_hex(4)}"
             elif is_march_2022:
-                disaster_id = f"fire-march-2022-{uuid.uuid4().hex[:8]}"
+                disaster_id = f"fire-march-2022-{token_hex(4)}"
             else:
                 disaster_type = data.get("type", "event").lower()
-                disaster_id = f"{disaster_type}-{uuid.uuid4().hex[:8]}"
+                disaster_id = f"{disaster_type}-{token_hex(4)}"
 
             response = {
                 "disaster_id": disaster_id,
@@ -76,14 +80,12 @@ def create_routes(orchestrator):
 
     @main_bp.route('/test/satellite', methods=['GET'])
     def test_satellite():
-        client = SatelliteClient()
-        data = asyncio.run(client.fetch_imagery({'lat': 43.7315, 'lon': -79.8620}))
+        data = run_async(satellite_client.fetch_imagery({'lat': 43.7315, 'lon': -79.8620}))
         return jsonify(data)
 
     @main_bp.route('/test/weather', methods=['GET'])
     def test_weather():
-        client = WeatherClient()
-        data = asyncio.run(client.fetch_current({'lat': 43.7315, 'lon': -79.8620}))
+        data = run_async(weather_client.fetch_current({'lat': 43.7315, 'lon': -79.8620}))
         return jsonify(data)
 
     @main_bp.route('/config', methods=['GET'])
@@ -14,6 +14,7 @@ generated 30-60 minutes before the first 911 call.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any
 
 # Historical fire location (HWY 407/410 interchange)
@@ -173,10 +174,14 @@ class July2020Scenario:
 july_2020_scenario = July2020Scenario()
 
 
+@lru_cache(maxsize=1)
 def load_july_2020_scenario() -> Dict[str, Any]:
     """
     Load the July 2020 scenario configuration
 
+    The configuration is validated and built once, then shared between
+    callers, so treat it as read-only.
+
     Returns:
         Complete scenario configuration dictionary
     """
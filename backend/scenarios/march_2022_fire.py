@@ -17,6 +17,7 @@ providing early warning before the fire escalated.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any
 
 # Historical fire location (Conestoga Drive area)
@@ -186,10 +187,14 @@ class March2022Scenario:
 march_2022_scenario = March2022Scenario()
 
 
+@lru_cache(maxsize=1)
 def load_march_2022_scenario() -> Dict[str, Any]:
     """
     Load the March 2022 scenario configuration
 
+    The configuration is validated and built once, then shared between
+    callers, so treat it as read-only.
+
     Returns:
         Complete scenario configuration dictionary
     """
@@ -1,9 +1,8 @@
 from flask_socketio import emit, join_room
-from orchestrator import DisasterOrchestrator
-from simulation import simulate_disaster_processing
-from utils.config import config
+from backend.simulation import simulate_disaster_processing
+from backend.utils.config import config
+from backend.utils.async_runner import run_async
 from datetime import datetime
-import asyncio
 import traceback
 
 def init_socketio(socketio, orchestrator):
@@ -36,7 +35,6 @@ def init_socketio(socketio, orchestrator):
         if disaster_id:
             print(f'[WebSocket] Client subscribed to disaster: {disaster_id} (mode: {mode})')
             join_room(disaster_id)
-            emit('subscribed', {'disaster_id': disaster_id, 'mode': mode})
             
             # Route to appropriate processing based on mode
             if mode == 'real_apis' and orchestrator:
@@ -46,6 +44,9 @@ def init_socketio(socketio, orchestrator):
                 # Use simulation with mock data
                 socketio.start_background_task(simulate_disaster_processing, socketio, disaster_id)
 
+            # Acknowledge via the Socket.IO ack instead of a separate 'subscribed' event
+            return {'disaster_id': disaster_id, 'mode': mode}
+
     @socketio.on('join_disaster')
     def handle_join_disaster(data):
         disaster_id = data.get('disaster_id')
@@ -73,7 +74,7 @@ def process_disaster_with_orchestrator(socketio, orchestrator, disaster_id, trig
         # Check if disaster already exists (e.g., from analyze-coordinates endpoint)
         if disaster_id not in orchestrator.active_disasters:
             # Create disaster in orchestrator only if it doesn't exist
-            orchestrator.active_disasters[disaster_id] = {
+            orchestrator.register_disaster(disaster_id, {
                 'id': disaster_id,
                 'type': trigger_data.get('type', 'wildfire'),
                 'location': trigger_data.get('location', {}),
@@ -83,16 +84,13 @@ def process_disaster_with_orchestrator(socketio, orchestrator, disaster_id, trig
                 'agent_results': {},
                 'plan': None,
                 'trigger': trigger_data,
-            }
+            })
             print(f'[Backend] Created new disaster: {disaster_id}')
         else:
             print(f'[Backend] Using existing disaster: {disaster_id}')
         
-        # Run async processing
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(orchestrator.process_disaster(disaster_id))
-        loop.close()
+        # Run on the shared loop so pooled HTTP sessions outlive this disaster
+        run_async(orchestrator.process_disaster(disaster_id))
         
     except Exception as e:
         error_details = traceback.format_exc()
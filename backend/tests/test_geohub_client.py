@@ -269,6 +269,40 @@ async def test_data_structure():
         traceback.print_exc()
 
 
+@pytest.mark.asyncio
+async def test_fetch_all():
+    """Test loading every layer concurrently"""
+    print("\n" + "="*60)
+    print("TEST 7: Concurrent Loading")
+    print("="*60)
+    
+    client = GeoHubClient()
+    location = {'lat': 43.7315, 'lon': -79.7624}
+    
+    infra, pop, roads = await client.fetch_all(location)
+    
+    assert len(infra) == len(await client.fetch_infrastructure(location))
+    assert len(pop) == len(await client.fetch_population(location))
+    assert len(roads) == len(await client.fetch_roads(location))
+    
+    print("\n✓ TEST PASSED: fetch_all matches the individual loaders")
+
+
+def test_exact_filter_uses_true_distance():
+    """Exact filtering keeps only points within the radius"""
+    client = GeoHubClient()
+    infra = client._create_sample_infrastructure()
+    location = {'lat': 43.7315, 'lon': -79.7624}
+    
+    rough = client._filter_by_location(infra, location, radius_km=2)
+    exact = client._filter_by_location(infra, location, radius_km=2, exact=True)
+    
+    # City Hall is at the search point and the EOC ~0.8 km away; features
+    # ~2.4-2.5 km out can fall inside the box corners but not the circle
+    assert set(exact['name']) == {'Brampton City Hall', 'Emergency Operations Centre'}
+    assert set(exact['name']) < set(rough['name'])
+
+
 async def run_all_tests():
     """Run all tests"""
     print("\n" + "="*60)
@@ -282,6 +316,8 @@ async def run_all_tests():
     await test_location_filtering()
     await test_data_cache()
     await test_data_structure()
+    await test_fetch_all()
+    test_exact_filter_uses_true_distance()
     
     print("\n" + "="*60)
     print("ALL TESTS COMPLETED")
@@ -0,0 +1,134 @@
+"""
+Tests for retries, circuit breaking and stale fallback on upstream calls
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from data import http_retry, ttl_cache
+from data.http_retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    UpstreamStatusError,
+    fetch_with_fallback,
+)
+from data.satellite_client import SatelliteClient
+from data.ttl_cache import TTLCache
+from data.weather_client import WeatherClient
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    async def instant_sleep(_):
+        return None
+    monkeypatch.setattr(http_retry.asyncio, 'sleep', instant_sleep)
+
+
+def make_request(outcomes):
+    """Request callable that raises or returns each outcome in turn"""
+    calls = []
+
+    async def request():
+        outcome = outcomes[len(calls)]
+        calls.append(outcome)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return request, calls
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors():
+    request, calls = make_request([UpstreamStatusError(503), {'temp': 20}])
+    cache = TTLCache(ttl_seconds=60)
+
+    result = await fetch_with_fallback(request, cache, 'k', CircuitBreaker())
+
+    assert result == {'temp': 20}
+    assert len(calls) == 2
+    assert cache.get('k') == {'temp': 20}
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried():
+    request, calls = make_request([UpstreamStatusError(401)])
+
+    with pytest.raises(UpstreamStatusError):
+        await fetch_with_fallback(request, TTLCache(ttl_seconds=60), 'k', CircuitBreaker())
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_stale_value(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, 'monotonic', lambda: now[0])
+    cache = TTLCache(ttl_seconds=60)
+    cache.set('k', {'temp': 18})
+    now[0] += 120
+
+    request, calls = make_request([UpstreamStatusError(502)] * 3)
+    result = await fetch_with_fallback(request, cache, 'k', CircuitBreaker())
+
+    assert result == {'temp': 18}
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_skips_upstream():
+    breaker = CircuitBreaker(fail_max=1, reset_timeout=30)
+    cache = TTLCache(ttl_seconds=60)
+
+    request, _ = make_request([UpstreamStatusError(500)] * 3)
+    with pytest.raises(UpstreamStatusError):
+        await fetch_with_fallback(request, cache, 'k', breaker)
+    assert breaker.is_open
+
+    request, calls = make_request([{'temp': 20}])
+    with pytest.raises(CircuitOpenError):
+        await fetch_with_fallback(request, cache, 'k', breaker)
+    assert calls == []
+
+
+def test_half_open_circuit_allows_one_trial(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(http_retry.time, 'monotonic', lambda: now[0])
+    breaker = CircuitBreaker(fail_max=1, reset_timeout=30)
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    now[0] += 30
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    now[0] += 30
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.allow()
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_without_cache_degrades_like_a_failed_fetch():
+    location = {'lat': 43.7315, 'lon': -79.7624}
+
+    satellite = SatelliteClient()
+    for _ in range(satellite._breaker.fail_max):
+        satellite._breaker.record_failure()
+    assert await satellite._fetch_active_fires(location) == []
+
+    weather = WeatherClient()
+    for _ in range(weather._breaker.fail_max):
+        weather._breaker.record_failure()
+    assert await weather.fetch_forecast(location) == {}
+    with pytest.raises(Exception, match="Weather API error: 503"):
+        await weather.fetch_current(location)
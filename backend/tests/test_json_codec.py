@@ -0,0 +1,36 @@
+"""
+Tests for the orjson-backed JSON codec
+"""
+
+import os
+import sys
+from datetime import date, datetime, timezone
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from utils import json_codec
+
+
+def test_provider_matches_flask_wire_format():
+    app = Flask(__name__)
+    payload = {
+        'created_at': datetime(2026, 7, 15, 14, 30, tzinfo=timezone.utc),
+        'day': date(2026, 7, 15),
+        'count': 3,
+    }
+
+    expected = DefaultJSONProvider(app).dumps(payload)
+    actual = json_codec.CodecJSONProvider(app).dumps(payload)
+
+    assert json_codec.loads(actual) == json_codec.loads(expected)
+    assert json_codec.loads(actual)['created_at'] == 'Wed, 15 Jul 2026 14:30:00 GMT'
+
+
+def test_default_sees_datetimes():
+    when = datetime(2026, 7, 15, 14, 30)
+
+    assert json_codec.dumps({'at': when}, default=str) == '{"at":"2026-07-15 14:30:00"}'
@@ -1,15 +1,18 @@
 import asyncio
+import json
 import os
+import subprocess
 import sys
+import threading
 import types
 import pytest
 from typing import Any, Dict, List
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 if "aiohttp" not in sys.modules:
     class _ClientTimeout:
-        def __init__(self, total: int | float | None = None):
+        def __init__(self, total: int | float | None = None, **kwargs: Any):
             self.total = total
 
     class _ClientSession:
@@ -153,6 +156,59 @@ async def test_create_and_fetch():
     print("✓ DisasterOrchestrator stores new disasters correctly")
 
 
+def test_active_disasters_evict_oldest(monkeypatch):
+    from backend.utils.config import config
+
+    monkeypatch.setattr(config, "MAX_ACTIVE_DISASTERS", 2)
+    orchestrator = DisasterOrchestrator(FakeSocket())
+
+    first = orchestrator.create_disaster({"type": "flood"})
+    second = orchestrator.create_disaster({"type": "flood"})
+    third = orchestrator.create_disaster({"type": "flood"})
+
+    assert orchestrator.get_disaster(first) is None
+    assert list(orchestrator.active_disasters) == [second, third]
+
+
+def test_get_disaster_falls_back_to_shared_store():
+    class FakeStore:
+        def __init__(self):
+            self.snapshots: Dict[str, Dict[str, Any]] = {}
+
+        def put(self, disaster: Dict[str, Any]) -> None:
+            self.snapshots[disaster["id"]] = dict(disaster)
+
+        def get(self, disaster_id: str):
+            return self.snapshots.get(disaster_id)
+
+    store = FakeStore()
+    orchestrator = DisasterOrchestrator(FakeSocket())
+    orchestrator._store = store
+
+    disaster_id = orchestrator.create_disaster({"type": "flood"})
+    assert store.snapshots[disaster_id]["status"] == "initializing"
+
+    # Another worker only has the shared snapshot
+    other_worker = DisasterOrchestrator(FakeSocket())
+    other_worker._store = store
+    store.snapshots[disaster_id]["plan"] = {"executive_summary": "Contained."}
+
+    assert other_worker.get_disaster(disaster_id)["type"] == "flood"
+    assert other_worker.get_plan(disaster_id) == {"executive_summary": "Contained."}
+    assert other_worker.get_disaster("missing") is None
+
+
+def test_clients_and_agents_are_built_on_first_use():
+    orchestrator = DisasterOrchestrator(FakeSocket())
+
+    assert orchestrator.data_clients.loaded() == {}
+    assert set(orchestrator.agents) == {"damage", "population", "routing", "resource", "prediction"}
+
+    routing = orchestrator.agents["routing"]
+    assert orchestrator.agents["routing"] is routing
+    assert list(orchestrator.agents.loaded()) == ["routing"]
+
+
 def test_build_master_prompt_structure():
     socket = FakeSocket()
     orchestrator = DisasterOrchestrator(socket)
@@ -212,13 +268,11 @@ def test_build_master_prompt_defaults():
     assert prompt.count("{}") >= 5  # each empty agent block renders a JSON placeholder
 
 
-def test_extract_section_and_missing_delimiter():
+def test_split_sections_and_missing_delimiter():
     socket = FakeSocket()
     orchestrator = DisasterOrchestrator(socket)
 
     llm_text = """
-### EXECUTIVE SUMMARY ###
-Critical update here.
 ### SITUATION OVERVIEW ###
 Detailed overview lines.
 ### COMMUNICATION TEMPLATES (ENGLISH) ###
@@ -228,19 +282,34 @@ Punjabi alert text.
 ### COMMUNICATION TEMPLATES (HINDI) ###
 Hindi alert text.
 """
-    summary = orchestrator._extract_section(
-        llm_text,
-        "### EXECUTIVE SUMMARY ###",
-        "### SITUATION OVERVIEW ###",
-    )
-    assert summary == "Critical update here."
+    parsed = orchestrator._parse_llm_response(llm_text)
 
-    missing_section = orchestrator._extract_section(
-        llm_text,
-        "### UNKNOWN SECTION ###",
-        "### SITUATION OVERVIEW ###",
-    )
-    assert missing_section.startswith("Error: Could not find section")
+    assert parsed["overview"] == "Detailed overview lines."
+    assert parsed["templates"]["hi"] == "Hindi alert text."
+    assert parsed["summary"].startswith("Error: Could not find section")
+
+
+def test_parse_july_2020_response():
+    socket = FakeSocket()
+    orchestrator = DisasterOrchestrator(socket)
+
+    llm_text = """===EXECUTIVE_SUMMARY===
+HWY 407 closure recommended.
+===SITUATION_OVERVIEW===
+Fire near the interchange.
+===COMMUNICATION_EN===
+Evacuate now.
+===COMMUNICATION_HI===
+Hindi alert text.
+===END===
+"""
+    parsed = orchestrator._parse_llm_response(llm_text, is_july_2020=True)
+
+    assert parsed["summary"] == "HWY 407 closure recommended."
+    assert parsed["overview"] == "Fire near the interchange."
+    assert parsed["templates"]["en"] == "Evacuate now."
+    assert parsed["templates"]["pa"] == "Error: Could not parse Punjabi template."
+    assert parsed["templates"]["hi"] == "Hindi alert text."
 
 
 def test_parse_llm_response_structure():
@@ -270,6 +339,27 @@ Hindi template text.
     assert parsed["templates"]["hi"] == "Hindi template text."
 
 
+def test_parse_llm_response_missing_section():
+    socket = FakeSocket()
+    orchestrator = DisasterOrchestrator(socket)
+
+    response = """
+### EXECUTIVE SUMMARY ###
+Summary text.
+### SITUATION OVERVIEW ###
+Overview text.
+### COMMUNICATION TEMPLATES (ENGLISH) ###
+English template text.
+"""
+
+    parsed = orchestrator._parse_llm_response(response)
+
+    assert parsed["summary"] == "Summary text."
+    assert parsed["overview"] == "Overview text."
+    assert parsed["templates"]["en"] == "English template text."
+    assert parsed["templates"]["pa"].startswith("Error: Could not find section")
+
+
 @pytest.mark.asyncio
 async def test_process_disaster_emits_progress_and_context():
     socket = FakeSocket()
@@ -317,10 +407,356 @@ async def test_process_disaster_emits_progress_and_context():
     assert final_event["payload"]["plan"]["resource_deployment"] == mock_agents["resource"]
 
 
+@pytest.mark.asyncio
+async def test_run_all_agents_waves():
+    socket = FakeSocket()
+    orchestrator = DisasterOrchestrator(socket)
+    for name in orchestrator.agents:
+        result = {"agent": name, "fire_perimeter": "perimeter"}
+        orchestrator.agents[name] = types.SimpleNamespace(
+            analyze=AsyncMock(return_value=result), analyze_sync=Mock(return_value=result)
+        )
+
+    disaster = {"id": "wildfire-1", "type": "wildfire", "location": {"lat": 43.7, "lon": -79.8}}
+    results = await orchestrator._run_all_agents(disaster, {"population": "pop"})
+
+    assert {name: result["agent"] for name, result in results.items()} == {
+        name: name for name in ("damage", "population", "routing", "resource", "prediction")
+    }
+    orchestrator.agents["population"].analyze_sync.assert_called_once_with("perimeter", "pop")
+    orchestrator.agents["resource"].analyze_sync.assert_called_once_with(
+        results["population"], results["routing"], None
+    )
+
+    progress = [evt["payload"]["progress"] for evt in socket.events if evt["event"] == "progress"]
+    assert progress == sorted(progress)
+
+
+@pytest.mark.asyncio
+async def test_run_all_agents_overlaps_cpu_bound_agents():
+    orchestrator = DisasterOrchestrator(FakeSocket())
+    # Population, routing and prediction only all reach the barrier if they run at once
+    barrier = threading.Barrier(3, timeout=5)
+
+    def blocking_agent(name):
+        def analyze_sync(*_args, **_kwargs):
+            barrier.wait()
+            return {"agent": name}
+        return types.SimpleNamespace(analyze_sync=analyze_sync)
+
+    for name in ("population", "routing", "prediction"):
+        orchestrator.agents[name] = blocking_agent(name)
+    orchestrator.agents["damage"] = types.SimpleNamespace(
+        analyze=AsyncMock(return_value={"agent": "damage"})
+    )
+    orchestrator.agents["resource"] = types.SimpleNamespace(
+        analyze_sync=Mock(return_value={"agent": "resource"})
+    )
+
+    disaster = {"id": "wildfire-1", "type": "wildfire", "location": {"lat": 43.7, "lon": -79.8}}
+    results = await orchestrator._run_all_agents(disaster, {})
+
+    assert {name: result["agent"] for name, result in results.items()} == {
+        name: name for name in ("damage", "population", "routing", "resource", "prediction")
+    }
+
+
+def test_disasters_run_on_the_shared_loop():
+    from backend import sockets
+    from backend.utils.async_runner import get_loop
+
+    loops = []
+
+    async def process_disaster(_disaster_id):
+        loops.append(asyncio.get_running_loop())
+
+    orchestrator = types.SimpleNamespace(
+        active_disasters={"wildfire-1": {}, "wildfire-2": {}},
+        process_disaster=process_disaster,
+        aclose=AsyncMock(),
+    )
+    for disaster_id in ("wildfire-1", "wildfire-2"):
+        sockets.process_disaster_with_orchestrator(FakeSocket(), orchestrator, disaster_id, {})
+
+    # Pooled HTTP sessions live on that loop and are not torn down per disaster
+    assert loops == [get_loop(), get_loop()]
+    orchestrator.aclose.assert_not_awaited()
+
+
+GEVENT_PIPELINE_SCRIPT = """
+from gevent import monkey
+monkey.patch_all()
+
+import types
+import gevent
+from backend.orchestrator import DisasterOrchestrator
+from backend.sockets import process_disaster_with_orchestrator
+
+class Socket:
+    def emit(self, *args, **kwargs):
+        pass
+
+async def nothing(_location):
+    return None
+
+socket = Socket()
+orchestrator = DisasterOrchestrator(socket)
+orchestrator.data_clients["satellite"] = types.SimpleNamespace(fetch_imagery=nothing)
+orchestrator.data_clients["weather"] = types.SimpleNamespace(
+    fetch_current=nothing, fetch_forecast=nothing
+)
+orchestrator.data_clients["geohub"] = types.SimpleNamespace(
+    fetch_population=nothing, fetch_infrastructure=nothing, fetch_roads=nothing
+)
+trigger = {"type": "wildfire", "location": {"lat": 43.7315, "lon": -79.7624}}
+gevent.spawn(process_disaster_with_orchestrator, socket, orchestrator, "wildfire-1", trigger).join()
+disaster = orchestrator.active_disasters["wildfire-1"]
+print(disaster["status"], ",".join(sorted(disaster["agent_results"])))
+"""
+
+
+def test_pipeline_runs_under_gevent_monkey_patching():
+    pytest.importorskip("gevent")
+    repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = {k: v for k, v in os.environ.items() if k != "OPENROUTER_API_KEY"}
+    env["PYTHONPATH"] = repo_root
+
+    # Patching is process-wide, so run the pipeline in a fresh interpreter
+    result = subprocess.run(
+        [sys.executable, "-c", GEVENT_PIPELINE_SCRIPT],
+        cwd=repo_root, env=env, capture_output=True, text=True, timeout=120,
+    )
+
+    assert result.returncode == 0, result.stderr
+    status, agents = result.stdout.splitlines()[-1].split()
+    assert status == "complete"
+    assert agents == "damage,population,prediction,resource,routing"
+
+
+@pytest.mark.asyncio
+async def test_read_llm_stream_emits_closed_sections():
+    socket = FakeSocket()
+    orchestrator = DisasterOrchestrator(socket)
+
+    deltas = ["### EXECUTIVE SUMMARY ###\nFire ", "spreading.\n### SITU", "ATION OVERVIEW ###\nWinds"]
+    lines = [b": OPENROUTER PROCESSING\n", b"\n"]
+    for delta in deltas:
+        event = {"choices": [{"delta": {"content": delta}}]}
+        lines.append(f"data: {json.dumps(event)}\n".encode())
+    lines.append(b"data: [DONE]\n")
+
+    async def content():
+        for line in lines:
+            yield line
+
+    text = await orchestrator._read_llm_stream(types.SimpleNamespace(content=content()), "wildfire-1")
+
+    assert text == "".join(deltas)
+    partials = [evt["payload"] for evt in socket.events if evt["event"] == "plan_partial"]
+    assert partials == [
+        {"disaster_id": "wildfire-1", "section": "EXECUTIVE SUMMARY", "content": "Fire spreading."},
+        {"disaster_id": "wildfire-1", "section": "SITUATION OVERVIEW", "content": "Winds"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_read_llm_stream_resets_partials_when_stream_breaks():
+    socket = FakeSocket()
+    orchestrator = DisasterOrchestrator(socket)
+
+    async def content():
+        event = {"choices": [{"delta": {"content": "### EXECUTIVE SUMMARY ###\nFire\n### SITUATION OVERVIEW ###\n"}}]}
+        yield f"data: {json.dumps(event)}\n".encode()
+        raise asyncio.TimeoutError()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await orchestrator._read_llm_stream(types.SimpleNamespace(content=content()), "wildfire-1")
+
+    assert [evt["event"] for evt in socket.events] == ["plan_partial", "plan_partial_reset"]
+    assert socket.events[-1]["payload"] == {"disaster_id": "wildfire-1"}
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_data_reports_sources_as_they_land():
+    socket = FakeSocket()
+    orchestrator = DisasterOrchestrator(socket)
+
+    async def slow_imagery(_location):
+        await asyncio.sleep(0.01)
+        return {"fires": []}
+
+    orchestrator.data_clients["satellite"] = types.SimpleNamespace(fetch_imagery=slow_imagery)
+    orchestrator.data_clients["weather"] = types.SimpleNamespace(
+        fetch_current=AsyncMock(side_effect=RuntimeError("API down")),
+        fetch_forecast=AsyncMock(return_value={"wind_speed": 5}),
+    )
+    orchestrator.data_clients["geohub"] = types.SimpleNamespace(
+        fetch_population=AsyncMock(return_value="pop"),
+        fetch_infrastructure=AsyncMock(return_value="infra"),
+        fetch_roads=AsyncMock(return_value="roads"),
+    )
+
+    disaster = {"id": "wildfire-1", "location": {"lat": 43.7, "lon": -79.8}}
+    results = await orchestrator._fetch_all_data(disaster)
+
+    assert results == {
+        "satellite": {"fires": []},
+        "weather_current": None,
+        "weather_forecast": {"wind_speed": 5},
+        "population": "pop",
+        "infrastructure": "infra",
+        "roads": "roads",
+    }
+    done = [
+        evt["payload"] for evt in socket.events
+        if evt["payload"].get("api_status", {}).get("status") in ("success", "fallback")
+    ]
+    assert [payload["progress"] for payload in done] == [13, 15, 17, 19, 21, 23]
+    assert done[-1]["api_status"]["name"] == "NASA FIRMS Satellite Data"
+    announced = [evt["payload"] for evt in socket.events if "api_statuses" in evt["payload"]]
+    assert len(announced) == 1
+    assert len(announced[0]["api_statuses"]) == 6
+
+
+def test_llm_sessions_are_kept_per_loop_and_closed_with_it(monkeypatch):
+    import backend.orchestrator as orchestrator_module
+
+    class FakeSession:
+        def __init__(self, **_kwargs):
+            self.closed = False
+
+        async def close(self):
+            self.closed = True
+
+    monkeypatch.setattr(orchestrator_module.aiohttp, "ClientSession", FakeSession)
+    monkeypatch.setattr(
+        orchestrator_module.aiohttp, "TCPConnector", lambda **_kwargs: None, raising=False
+    )
+    orchestrator = DisasterOrchestrator(FakeSocket())
+
+    async def session():
+        return orchestrator._get_session()[0]
+
+    first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        first = first_loop.run_until_complete(session())
+        second = second_loop.run_until_complete(session())
+        assert first is not second
+        assert first_loop.run_until_complete(session()) is first
+
+        first_loop.run_until_complete(orchestrator.aclose())
+        assert first.closed and not second.closed
+        second_loop.run_until_complete(orchestrator.aclose())
+        assert second.closed
+        assert orchestrator._http == {}
+    finally:
+        first_loop.close()
+        second_loop.close()
+
+
+def test_llm_session_is_reused_across_disasters(monkeypatch):
+    import backend.orchestrator as orchestrator_module
+    from backend.utils.async_runner import run_async
+
+    created = []
+
+    class FakeSession:
+        def __init__(self, **_kwargs):
+            self.closed = False
+            created.append(self)
+
+    monkeypatch.setattr(orchestrator_module.aiohttp, "ClientSession", FakeSession)
+    monkeypatch.setattr(
+        orchestrator_module.aiohttp, "TCPConnector", lambda **_kwargs: None, raising=False
+    )
+    orchestrator = DisasterOrchestrator(FakeSocket())
+
+    async def session():
+        return orchestrator._get_session()
+
+    # Each disaster is a separate run_async() call on the shared loop
+    first, second = run_async(session()), run_async(session())
+
+    assert first is second
+    assert len(created) == 1
+
+
+class FakeLLMResponse:
+    def __init__(self, status: int, body: Dict[str, Any] | None = None):
+        self.status = status
+        self.headers = {"Retry-After": "0"} if status == 429 else {}
+        self.content_type = "application/json"
+        self._body = json.dumps(body or {}).encode()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self) -> str:
+        return self._body.decode()
+
+
+@pytest.mark.asyncio
+async def test_call_llm_api_retries_transient_status(monkeypatch):
+    import backend.orchestrator as orchestrator_module
+
+    async def instant_sleep(_):
+        return None
+
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+    monkeypatch.setattr(orchestrator_module.asyncio, "sleep", instant_sleep)
+
+    content = "### EXECUTIVE SUMMARY ###\nContained."
+    responses = [
+        FakeLLMResponse(429),
+        FakeLLMResponse(503),
+        FakeLLMResponse(200, {"choices": [{"message": {"content": content}}]}),
+    ]
+    orchestrator = DisasterOrchestrator(FakeSocket())
+    session = types.SimpleNamespace(post=lambda *args, **kwargs: responses.pop(0))
+    orchestrator._get_session = lambda: (session, asyncio.Semaphore(1))
+    orchestrator._parse_llm_response = lambda text, is_july_2020=False: {"summary": text}
+
+    result = await orchestrator._call_llm_api({"agent_outputs": {}})
+
+    assert result == {"summary": content}
+    assert responses == []
+
+
+@pytest.mark.asyncio
+async def test_call_llm_api_reuses_response_for_same_agent_outputs(monkeypatch):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+    content = "### EXECUTIVE SUMMARY ###\nContained."
+    responses = [FakeLLMResponse(200, {"choices": [{"message": {"content": content}}]})]
+
+    orchestrator = DisasterOrchestrator(FakeSocket())
+    session = types.SimpleNamespace(post=lambda *args, **kwargs: responses.pop(0))
+    orchestrator._get_session = lambda: (session, asyncio.Semaphore(1))
+    orchestrator._parse_llm_response = lambda text, is_july_2020=False: {"summary": text}
+
+    context = {
+        "disaster_type": "wildfire",
+        "location": {"lat": 43.7312, "lon": -79.8620},
+        "agent_outputs": {"damage": {"severity": "high"}},
+    }
+    first = await orchestrator._call_llm_api({**context, "disaster_id": "a", "timestamp": "t1"})
+    nearby = {**context, "location": {"lat": 43.7314, "lon": -79.8620}}
+    second = await orchestrator._call_llm_api({**nearby, "disaster_id": "b", "timestamp": "t2"})
+
+    assert first == second == {"summary": content}
+    assert responses == []
+
+
 async def main():
     await test_disaster_pipeline()
     await test_create_and_fetch()
     await test_process_disaster_emits_progress_and_context()
+    await test_run_all_agents_waves()
     print("\n✅ All DisasterOrchestrator tests passed!")
 
 
@@ -120,6 +120,36 @@ async def test_get_center_point():
     print("✓ Center point extracted correctly")
 
 
+@pytest.mark.asyncio
+async def test_get_center_point_area_weighted():
+    """Test center point is not biased toward densely sampled edges"""
+    agent = RoutingAgent()
+
+    # Rectangle with extra vertices bunched along its top-right edge
+    fire_perimeter = {
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[
+                [-79.8700, 43.7300],
+                [-79.8500, 43.7300],
+                [-79.8500, 43.7400],
+                [-79.8510, 43.7400],
+                [-79.8520, 43.7400],
+                [-79.8530, 43.7400],
+                [-79.8700, 43.7400],
+                [-79.8700, 43.7300]
+            ]]
+        }
+    }
+
+    center = agent._get_center_point(fire_perimeter)
+
+    assert center[0] == pytest.approx(-79.8600, abs=1e-9)
+    assert center[1] == pytest.approx(43.7350, abs=1e-9)
+
+    print("✓ Area-weighted center point computed correctly")
+
+
 @pytest.mark.asyncio
 async def test_get_center_point_default():
     """Test center point returns default when perimeter is invalid"""
@@ -353,6 +383,28 @@ async def test_july_2020_scenario():
     print("✓ July 2020 scenario routing works correctly")
 
 
+@pytest.mark.asyncio
+async def test_generate_evacuation_routes_cached_copies():
+    """Test repeated route generation reuses the cache but returns private copies"""
+    agent = RoutingAgent()
+    origin = [-79.86003, 43.73204]
+
+    first = agent._generate_evacuation_routes(origin, 0.5, "monitor")
+    first[0]['status'] = 'Mutated'
+    nearby = agent._generate_evacuation_routes([-79.86001, 43.73196], 0.5, "monitor")
+    second = agent._generate_evacuation_routes(origin, 0.5, "monitor")
+
+    assert second[0]['status'] == 'monitor'
+    assert nearby[0]['distance_km'] == second[0]['distance_km']
+
+    # The cache key is rounded, but the response keeps the exact origin
+    assert second[0]['origin'] == {'lat': 43.73204, 'lon': -79.86003}
+    assert second[0]['path']['geometry']['coordinates'][0] == [-79.86003, 43.73204]
+    assert nearby[0]['origin'] == {'lat': 43.73196, 'lon': -79.86001}
+
+    print("✓ Cached routes are copied per call")
+
+
 # Direct execution
 if __name__ == "__main__":
     async def run_tests():
@@ -364,6 +416,7 @@ if __name__ == "__main__":
         await test_routing_agent_initialization()
         await test_analyze_basic_flow()
         await test_get_center_point()
+        await test_get_center_point_area_weighted()
         await test_get_center_point_default()
         await test_calculate_distance()
         await test_generate_route_path()
@@ -374,6 +427,7 @@ if __name__ == "__main__":
         await test_route_time_estimation()
         await test_route_destinations_have_capacity()
         await test_july_2020_scenario()
+        await test_generate_evacuation_routes_cached_copies()
         
         print()
         print("=" * 60)
@@ -0,0 +1,53 @@
+"""
+Tests for the TTL cache used by the external API clients
+"""
+
+import os
+import sys
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from data import ttl_cache
+from data.ttl_cache import TTLCache, location_key
+
+
+def test_location_key_rounds_to_about_1km():
+    assert location_key({'lat': 43.73149, 'lon': -79.86201}) == (43.73, -79.86)
+    assert location_key({'lat': 43.7315, 'lon': -79.8620}) == location_key({'lat': 43.7344, 'lon': -79.8649})
+
+
+def test_get_returns_copy():
+    cache = TTLCache(ttl_seconds=60)
+    cache.set('k', {'temp': 20})
+
+    first = cache.get('k')
+    first['temp'] = 99
+
+    assert cache.get('k') == {'temp': 20}
+
+
+def test_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, 'monotonic', lambda: now[0])
+
+    cache = TTLCache(ttl_seconds=600)
+    cache.set('k', [1, 2, 3])
+    now[0] += 599
+    assert cache.get('k') == [1, 2, 3]
+
+    now[0] += 1
+    assert cache.get('k') is None
+    assert cache.get('k', allow_stale=True) == [1, 2, 3]
+
+
+def test_evicts_least_recently_used():
+    cache = TTLCache(ttl_seconds=60, maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
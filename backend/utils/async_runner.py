@@ -0,0 +1,62 @@
+"""
+Persistent asyncio loop for calling async code from Flask handlers
+
+Disaster processing runs here too, so HTTP sessions created on this loop
+are pooled across disasters for the life of the process.
+"""
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional
+
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create an event loop that starts tasks eagerly where supported
+
+    With eager tasks (Python 3.12+), coroutines run synchronously until
+    their first real suspension, so awaits that complete immediately skip
+    a trip through the scheduler.
+    """
+    loop = asyncio.new_event_loop()
+    eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+    if eager_task_factory is not None:
+        loop.set_task_factory(eager_task_factory)
+    return loop
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background loop, starting its thread on first use"""
+    global _loop
+
+    with _lock:
+        if _loop is None:
+            loop = new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name="async-runner",
+                daemon=True,
+            )
+            thread.start()
+            _loop = loop
+
+    return _loop
+
+
+def run_async(coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+    """
+    Run a coroutine on the shared loop and block until it finishes
+
+    Args:
+        coro: Coroutine to execute
+        timeout: Seconds to wait for the result (None waits indefinitely)
+
+    Returns:
+        The coroutine's result; exceptions are re-raised in the caller
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_loop())
+    return future.result(timeout)
@@ -2,6 +2,7 @@
 Cached data loader for demo mode
 """
 
+import copy
 import os
 import json
 from typing import Dict, Optional
@@ -9,30 +10,40 @@ from typing import Dict, Optional
 
 CACHED_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'cached_data')
 
+# Parsed july_2020_response.json, loaded on first use
+_july_2020_response: Optional[Dict] = None
+
 
 def load_cached_july_2020() -> Optional[Dict]:
     """
     Load cached July 2020 response
 
+    The file is parsed once; each call returns a fresh copy because callers
+    annotate the plan they receive.
+
     Returns:
         Complete cached response or None if not found
     """
-    cache_path = os.path.join(CACHED_DATA_DIR, 'july_2020_response.json')
+    global _july_2020_response
+
+    if _july_2020_response is None:
+        cache_path = os.path.join(CACHED_DATA_DIR, 'july_2020_response.json')
+
+        if not os.path.exists(cache_path):
+            print(f"[CachedLoader] Warning: Cache file not found at {cache_path}")
+            return None
 
-    if not os.path.exists(cache_path):
-        print(f"[CachedLoader] Warning: Cache file not found at {cache_path}")
-        return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                _july_2020_response = json.load(f)
 
-    try:
-        with open(cache_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            print("[CachedLoader] Successfully loaded cached July 2020 response")
 
-        print("[CachedLoader] Successfully loaded cached July 2020 response")
-        return data
+        except Exception as e:
+            print(f"[CachedLoader] Error loading cache: {e}")
+            return None
 
-    except Exception as e:
-        print(f"[CachedLoader] Error loading cache: {e}")
-        return None
+    return copy.deepcopy(_july_2020_response)
 
 
 def is_cached_data_available() -> bool:
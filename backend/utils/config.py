@@ -1,7 +1,4 @@
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
 
 class Config:
     # API Keys
@@ -23,6 +20,21 @@ class Config:
     # When False, uses mock/simulation data
     USE_REAL_APIS = os.getenv('USE_REAL_APIS', 'False') == 'True'
 
+    # Socket.IO message queue (e.g. redis://localhost:6379/0)
+    # Required when running more than one server worker so room broadcasts
+    # reach clients connected to any worker. Leave unset for a single process.
+    SOCKETIO_MESSAGE_QUEUE = os.getenv('SOCKETIO_MESSAGE_QUEUE') or None
+
+    # Shared disaster state (e.g. redis://localhost:6379/1) so any worker can
+    # serve status and plan requests. Leave unset for a single process.
+    DISASTER_STORE_URL = os.getenv('DISASTER_STORE_URL') or None
+
+    # Disasters kept in memory before the oldest are evicted
+    MAX_ACTIVE_DISASTERS = int(os.getenv('MAX_ACTIVE_DISASTERS', 100))
+
+    # Concurrent OpenRouter requests allowed per event loop
+    LLM_MAX_INFLIGHT = int(os.getenv('LLM_MAX_INFLIGHT', 4))
+
     # Update intervals
     UPDATE_INTERVAL_SECONDS = 900  # 15 minutes
 
@@ -0,0 +1,61 @@
+"""
+Shared disaster state for running more than one server worker
+
+Each worker keeps the disasters it is processing in memory. When
+DISASTER_STORE_URL points at Redis, a JSON snapshot of every disaster is
+written there on each status change so any worker can answer status and
+plan requests, including after the processing worker restarts.
+"""
+
+from typing import Any, Dict, Optional
+
+from backend.utils import json_codec
+
+try:
+    import redis
+except ImportError:
+    # Only needed when DISASTER_STORE_URL is set
+    redis = None
+
+
+STORE_TTL_SECONDS = 24 * 3600
+KEY_PREFIX = 'disaster:'
+
+# Raw inputs (GIS frames, fire points) stay with the worker that fetched them
+LOCAL_ONLY_KEYS = frozenset({'data'})
+
+
+class DisasterStore:
+    """Redis-backed snapshots of disaster state keyed by disaster ID"""
+
+    def __init__(self, url: str, ttl_seconds: int = STORE_TTL_SECONDS):
+        if redis is None:
+            raise RuntimeError("DISASTER_STORE_URL is set but the redis package is not installed")
+        self._client = redis.Redis.from_url(url, socket_timeout=1)
+        self._ttl_seconds = ttl_seconds
+
+    def put(self, disaster: Dict[str, Any]) -> None:
+        """Store a snapshot; failures are logged so processing carries on"""
+        snapshot = {k: v for k, v in disaster.items() if k not in LOCAL_ONLY_KEYS}
+        try:
+            self._client.set(
+                KEY_PREFIX + disaster['id'],
+                json_codec.dumps(snapshot, default=str),
+                ex=self._ttl_seconds,
+            )
+        except redis.RedisError as e:
+            print(f"[DisasterStore] Could not save {disaster['id']}: {e}")
+
+    def get(self, disaster_id: str) -> Optional[Dict[str, Any]]:
+        """Return the latest snapshot, or None if missing or unreachable"""
+        try:
+            raw = self._client.get(KEY_PREFIX + disaster_id)
+        except redis.RedisError as e:
+            print(f"[DisasterStore] Could not load {disaster_id}: {e}")
+            return None
+        return json_codec.loads(raw) if raw is not None else None
+
+
+def create_disaster_store(url: Optional[str]) -> Optional[DisasterStore]:
+    """Build the shared store, or None to keep state in this process only"""
+    return DisasterStore(url) if url else None
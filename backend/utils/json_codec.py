@@ -0,0 +1,84 @@
+"""
+JSON encoding for Socket.IO packets and HTTP responses
+
+Uses orjson when available and falls back to the standard library. The
+dumps/loads signatures mirror the json module so this can be passed
+anywhere a json module is expected.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    # Fallback for systems without orjson
+    orjson = None
+
+
+_COMPACT_SEPARATORS = (',', ':')
+
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: Optional[int] = None,
+    default: Optional[Callable[[Any], Any]] = None,
+    sort_keys: bool = False,
+    **kwargs,
+) -> str:
+    """
+    Serialize obj to a JSON string
+
+    orjson only supports compact output or two-space indentation; any other
+    formatting option is handled by the standard library. When default is
+    given it also receives datetime, date and time objects, so both paths
+    format them the same way.
+    """
+    separators = kwargs.pop('separators', None)
+    use_orjson = (
+        orjson is not None
+        and not kwargs
+        and indent in (None, 2)
+        and (indent is not None or separators in (None, _COMPACT_SEPARATORS))
+    )
+
+    if use_orjson:
+        options = _ORJSON_OPTIONS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        if sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if default is not None:
+            # Let default format datetimes, as it would under the json module
+            options |= orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(obj, default=default, option=options).decode('utf-8')
+
+    return json.dumps(
+        obj, indent=indent, separators=separators, default=default, sort_keys=sort_keys, **kwargs
+    )
+
+
+def loads(s, **kwargs) -> Any:
+    """Deserialize a JSON document from str or bytes"""
+    if orjson is not None and not kwargs:
+        return orjson.loads(s)
+    return json.loads(s, **kwargs)
+
+
+class CodecJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes through this module"""
+
+    def dumps(self, obj: Any, **kwargs) -> str:
+        kwargs.setdefault('default', self.default)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        # orjson always emits UTF-8, which is valid JSON either way
+        kwargs.pop('ensure_ascii', None)
+        return dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs) -> Any:
+        return loads(s, **kwargs)
@@ -17,6 +17,7 @@ function useDisaster() {
   const [error, setError] = useState(null);
   const [statusMessage, setStatusMessage] = useState('');
   const [apiStatus, setApiStatus] = useState(null); // For tracking API fetch status
+  const [planSections, setPlanSections] = useState({}); // Plan sections streamed before the full plan
 
   // WebSocket
   const { connected, on, subscribeToDisaster } = useWebSocket();
@@ -36,6 +37,7 @@ function useDisaster() {
       setPlan(null);
       setStatusMessage('Initializing disaster simulation...');
       setApiStatus(null); // Reset API status
+      setPlanSections({});
 
       let response;
       
@@ -81,6 +83,7 @@ function useDisaster() {
     console.log('[useDisaster] Clearing disaster state');
     setDisaster(null);
     setPlan(null);
+    setPlanSections({});
     setLoading(false);
     setProgress(0);
     setError(null);
@@ -102,12 +105,16 @@ function useDisaster() {
       setProgress(data.progress || 0);
       setStatusMessage(data.message || getProgressMessage(data.progress, data.phase));
       
-      // Track API status if provided
-      if (data.api_status) {
-        setApiStatus(prev => ({
-          ...prev,
-          [data.api_status.name]: data.api_status
-        }));
+      // Track API status if provided (api_statuses batches several sources)
+      const statuses = data.api_statuses || (data.api_status ? [data.api_status] : []);
+      if (statuses.length > 0) {
+        setApiStatus(prev => {
+          const next = { ...prev };
+          statuses.forEach(status => {
+            next[status.name] = status;
+          });
+          return next;
+        });
       }
     });
 
@@ -115,11 +122,24 @@ function useDisaster() {
     const cleanupComplete = on('disaster_complete', (data) => {
       console.log('[useDisaster] Disaster processing complete:', data);
       setPlan(data.plan);
+      setPlanSections({});
       setLoading(false);
       setProgress(100);
       setStatusMessage('Emergency response plan generated');
     });
 
+    // Plan sections as the LLM finishes writing them
+    const cleanupPlanPartial = on('plan_partial', (data) => {
+      console.log('[useDisaster] Plan section received:', data.section);
+      setPlanSections(prev => ({ ...prev, [data.section]: data.content }));
+    });
+
+    // A streamed plan broke off and is being retried; drop what arrived
+    const cleanupPlanPartialReset = on('plan_partial_reset', () => {
+      console.log('[useDisaster] Discarding streamed plan sections');
+      setPlanSections({});
+    });
+
     // Plan updates (15-minute auto-refresh)
     const cleanupPlanUpdate = on('plan_update', (data) => {
       console.log('[useDisaster] Plan update received:', data);
@@ -139,6 +159,8 @@ function useDisaster() {
     return () => {
       if (cleanupProgress) cleanupProgress();
       if (cleanupComplete) cleanupComplete();
+      if (cleanupPlanPartial) cleanupPlanPartial();
+      if (cleanupPlanPartialReset) cleanupPlanPartialReset();
       if (cleanupPlanUpdate) cleanupPlanUpdate();
       if (cleanupError) cleanupError();
     };
@@ -167,6 +189,7 @@ function useDisaster() {
     error,
     statusMessage,
     apiStatus,
+    planSections,
 
     // Methods
     triggerDisaster,